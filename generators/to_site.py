@@ -32,10 +32,11 @@ STATIC_DIR = GENERATOR_DIR / "static"
 def cue_export(expr: str) -> dict | list:
     result = subprocess.run(
         ["cue", "export", "./model/", "-e", expr],
-        capture_output=True, text=True
+        capture_output=True,
     )
     if result.returncode != 0:
-        print(f"ERROR: cue export -e '{expr}' failed:\n{result.stderr}", file=sys.stderr)
+        stderr = result.stderr.decode("utf-8", "replace")
+        print(f"ERROR: cue export -e '{expr}' failed:\n{stderr}", file=sys.stderr)
         sys.exit(1)
     return json.loads(result.stdout)
 
@@ -161,37 +161,40 @@ def main():
     cached_count = 0
     failed = 0
 
-    for symbol in sorted(GENES.keys()):
-        if symbol in cache:
-            entry = cache[symbol]
-            pli = entry.get("pli")
+    try:
+        for symbol in sorted(GENES.keys()):
+            if symbol in cache:
+                entry = cache[symbol]
+                pli = entry.get("pli")
+                pli_str = f"pLI={pli:.3f}" if pli is not None else "no constraint"
+                print(f"  {symbol}: cached ({pli_str})")
+                gnomad_data[symbol] = entry
+                report.cached(symbol, pli_str)
+                cached_count += 1
+                continue
+
+            print(f"  {symbol}: querying gnomAD...", end=" ", flush=True)
+            result = fetch_gnomad_gene(symbol)
+            time.sleep(REQUEST_DELAY)
+
+            if result is None:
+                print(f"FAILED (skipping)", file=sys.stderr)
+                report.failed(symbol, "API returned no data")
+                failed += 1
+                continue
+
+            pli = result.get("pli")
             pli_str = f"pLI={pli:.3f}" if pli is not None else "no constraint"
-            print(f"  {symbol}: cached ({pli_str})")
-            gnomad_data[symbol] = entry
-            report.cached(symbol, pli_str)
-            cached_count += 1
-            continue
-
-        print(f"  {symbol}: querying gnomAD...", end=" ", flush=True)
-        result = fetch_gnomad_gene(symbol)
-        time.sleep(REQUEST_DELAY)
-
-        if result is None:
-            print(f"FAILED (skipping)", file=sys.stderr)
-            report.failed(symbol, "API returned no data")
-            failed += 1
-            continue
-
-        pli = result.get("pli")
-        pli_str = f"pLI={pli:.3f}" if pli is not None else "no constraint"
-        loeuf = result.get("loeuf")
-        loeuf_str = f"LOEUF={loeuf:.3f}" if loeuf is not None else "n/a"
-        print(f"{pli_str}, {loeuf_str}")
-
-        gnomad_data[symbol] = result
-        cache[symbol] = result
-        report.ok(symbol, f"{pli_str}, {loeuf_str}")
-        fetched += 1
+            loeuf = result.get("loeuf")
+            loeuf_str = f"LOEUF={loeuf:.3f}" if loeuf is not None else "n/a"
+            print(f"{pli_str}, {loeuf_str}")
+
+            gnomad_data[symbol] = result
+            cache[symbol] = result
+            report.ok(symbol, f"{pli_str}, {loeuf_str}")
+            fetched += 1
+    finally:
+        report.flush_warnings()
 
     # Save updated cache
     save_cache(cache)
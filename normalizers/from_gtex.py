@@ -248,32 +248,35 @@ def main():
     gtex_data = {}
     fetched = 0
 
-    for symbol in sorted(GENES.keys()):
-        if symbol in cache:
-            entry = cache[symbol]
-            n_tissues = len(entry.get("top_tissues", []))
-            print(f"  {symbol}: cached (ensembl={entry['ensembl_id']}, {n_tissues} tissues)")
-            gtex_data[symbol] = entry
-            report.cached(symbol, f"ensembl={entry['ensembl_id']}")
-            continue
-
-        print(f"  {symbol}: querying...", end=" ", flush=True)
-        result = query_gene(symbol)
-        time.sleep(REQUEST_DELAY)
-
-        if result is None:
-            print("FAILED (no Ensembl ID)")
-            report.failed(symbol, "could not resolve Ensembl ID")
-            continue
-
-        n_tissues = len(result.get("top_tissues", []))
-        cranio = result["craniofacial_expression"]
-        print(f"ensembl={result['ensembl_id']}, {n_tissues} tissues, cranio={cranio}")
-
-        gtex_data[symbol] = result
-        cache[symbol] = result
-        report.ok(symbol, f"ensembl={result['ensembl_id']}, {n_tissues} tissues")
-        fetched += 1
+    try:
+        for symbol in sorted(GENES.keys()):
+            if symbol in cache:
+                entry = cache[symbol]
+                n_tissues = len(entry.get("top_tissues", []))
+                print(f"  {symbol}: cached (ensembl={entry['ensembl_id']}, {n_tissues} tissues)")
+                gtex_data[symbol] = entry
+                report.cached(symbol, f"ensembl={entry['ensembl_id']}")
+                continue
+
+            print(f"  {symbol}: querying...", end=" ", flush=True)
+            result = query_gene(symbol)
+            time.sleep(REQUEST_DELAY)
+
+            if result is None:
+                print("FAILED (no Ensembl ID)")
+                report.failed(symbol, "could not resolve Ensembl ID")
+                continue
+
+            n_tissues = len(result.get("top_tissues", []))
+            cranio = result["craniofacial_expression"]
+            print(f"ensembl={result['ensembl_id']}, {n_tissues} tissues, cranio={cranio}")
+
+            gtex_data[symbol] = result
+            cache[symbol] = result
+            report.ok(symbol, f"ensembl={result['ensembl_id']}, {n_tissues} tissues")
+            fetched += 1
+    finally:
+        report.flush_warnings()
 
     # Save updated cache
     save_cache(cache)
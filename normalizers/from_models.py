@@ -151,43 +151,46 @@ def main():
     cached_count = 0
     failed = 0
 
-    for symbol in sorted(GENES.keys()):
-        ncbi_id = GENES[symbol].get("ncbi", "")
-        if not ncbi_id:
-            print(f"  {symbol}: no NCBI ID, skipping", file=sys.stderr)
-            report.skipped(symbol, "no NCBI ID")
-            continue
-
-        if symbol in cache:
-            entry = cache[symbol]
-            mouse = entry.get("mouse_count", 0)
-            zfish = entry.get("zebrafish_count", 0)
-            detail = f"mouse={mouse}, zebrafish={zfish}"
-            print(f"  {symbol}: cached ({detail})")
-            models_data[symbol] = entry
-            report.cached(symbol, detail)
-            cached_count += 1
-            continue
+    try:
+        for symbol in sorted(GENES.keys()):
+            ncbi_id = GENES[symbol].get("ncbi", "")
+            if not ncbi_id:
+                print(f"  {symbol}: no NCBI ID, skipping", file=sys.stderr)
+                report.skipped(symbol, "no NCBI ID")
+                continue
 
-        print(f"  {symbol}: querying NCBI orthologs...", end=" ", flush=True)
-        result = fetch_model_organisms(symbol, ncbi_id)
-        time.sleep(REQUEST_DELAY)
+            if symbol in cache:
+                entry = cache[symbol]
+                mouse = entry.get("mouse_count", 0)
+                zfish = entry.get("zebrafish_count", 0)
+                detail = f"mouse={mouse}, zebrafish={zfish}"
+                print(f"  {symbol}: cached ({detail})")
+                models_data[symbol] = entry
+                report.cached(symbol, detail)
+                cached_count += 1
+                continue
 
-        if result is None:
-            print("FAILED (skipping)", file=sys.stderr)
-            report.failed(symbol, "API returned no data")
-            failed += 1
-            continue
+            print(f"  {symbol}: querying NCBI orthologs...", end=" ", flush=True)
+            result = fetch_model_organisms(symbol, ncbi_id)
+            time.sleep(REQUEST_DELAY)
 
-        mouse = result.get("mouse_count", 0)
-        zfish = result.get("zebrafish_count", 0)
-        detail = f"mouse={mouse}, zebrafish={zfish}"
-        print(detail)
+            if result is None:
+                print("FAILED (skipping)", file=sys.stderr)
+                report.failed(symbol, "API returned no data")
+                failed += 1
+                continue
 
-        models_data[symbol] = result
-        cache[symbol] = result
-        report.ok(symbol, detail)
-        fetched += 1
+            mouse = result.get("mouse_count", 0)
+            zfish = result.get("zebrafish_count", 0)
+            detail = f"mouse={mouse}, zebrafish={zfish}"
+            print(detail)
+
+            models_data[symbol] = result
+            cache[symbol] = result
+            report.ok(symbol, detail)
+            fetched += 1
+    finally:
+        report.flush_warnings()
 
     # Save updated cache
     save_cache(cache)
@@ -172,31 +172,34 @@ def main():
     reporter_data = {}
     fetched = 0
 
-    for symbol in sorted(GENES.keys()):
-        if symbol in cache:
-            cached_count = cache[symbol]["active_grant_count"]
-            print(f"  {symbol}: cached ({cached_count} grants)")
-            reporter_data[symbol] = cache[symbol]
-            report.cached(symbol, f"{cached_count} grants")
-            continue
-
-        print(f"  {symbol}: querying NIH Reporter...", end=" ", flush=True)
-        result = fetch_projects(symbol)
-        time.sleep(REQUEST_DELAY)
-
-        if result is None:
-            print("FAILED")
-            report.failed(symbol, "API request failed")
-            continue
-
-        grant_count = result["active_grant_count"]
-        proj_count = len(result["projects"])
-        print(f"{grant_count} grants, {proj_count} projects returned")
-
-        reporter_data[symbol] = result
-        cache[symbol] = result
-        report.ok(symbol, f"{grant_count} grants")
-        fetched += 1
+    try:
+        for symbol in sorted(GENES.keys()):
+            if symbol in cache:
+                cached_count = cache[symbol]["active_grant_count"]
+                print(f"  {symbol}: cached ({cached_count} grants)")
+                reporter_data[symbol] = cache[symbol]
+                report.cached(symbol, f"{cached_count} grants")
+                continue
+
+            print(f"  {symbol}: querying NIH Reporter...", end=" ", flush=True)
+            result = fetch_projects(symbol)
+            time.sleep(REQUEST_DELAY)
+
+            if result is None:
+                print("FAILED")
+                report.failed(symbol, "API request failed")
+                continue
+
+            grant_count = result["active_grant_count"]
+            proj_count = len(result["projects"])
+            print(f"{grant_count} grants, {proj_count} projects returned")
+
+            reporter_data[symbol] = result
+            cache[symbol] = result
+            report.ok(symbol, f"{grant_count} grants")
+            fetched += 1
+    finally:
+        report.flush_warnings()
 
     # Save updated cache
     save_cache(cache)
@@ -218,43 +218,46 @@ def main():
     failed = 0
     skipped = 0
 
-    for symbol in sorted(GENES.keys()):
-        ensembl_id = ensembl_map.get(symbol)
-        if not ensembl_id:
-            print(f"  {symbol}: skipping (no Ensembl ID in gnomAD cache)")
-            report.skipped(symbol, "no Ensembl ID")
-            skipped += 1
-            continue
-
-        if symbol in cache:
-            entry = cache[symbol]
-            drug_count = entry.get("drug_count", 0)
-            detail = f"{drug_count} drugs" if drug_count > 0 else "no drugs"
-            print(f"  {symbol}: cached ({detail})")
-            opentargets_data[symbol] = entry
-            report.cached(symbol, detail)
-            cached_count += 1
-            continue
-
-        print(f"  {symbol}: querying Open Targets...", end=" ", flush=True)
-        result = fetch_opentargets_gene(ensembl_id, symbol)
-        time.sleep(REQUEST_DELAY)
-
-        if result is None:
-            print(f"FAILED (skipping)", file=sys.stderr)
-            report.failed(symbol, "API returned no data")
-            failed += 1
-            continue
-
-        drug_count = result.get("drug_count", 0)
-        max_phase = result.get("max_phase", 0)
-        detail = f"{drug_count} drugs, max phase {max_phase}" if drug_count > 0 else "no drugs"
-        print(detail)
-
-        opentargets_data[symbol] = result
-        cache[symbol] = result
-        report.ok(symbol, detail)
-        fetched += 1
+    try:
+        for symbol in sorted(GENES.keys()):
+            ensembl_id = ensembl_map.get(symbol)
+            if not ensembl_id:
+                print(f"  {symbol}: skipping (no Ensembl ID in gnomAD cache)")
+                report.skipped(symbol, "no Ensembl ID")
+                skipped += 1
+                continue
+
+            if symbol in cache:
+                entry = cache[symbol]
+                drug_count = entry.get("drug_count", 0)
+                detail = f"{drug_count} drugs" if drug_count > 0 else "no drugs"
+                print(f"  {symbol}: cached ({detail})")
+                opentargets_data[symbol] = entry
+                report.cached(symbol, detail)
+                cached_count += 1
+                continue
+
+            print(f"  {symbol}: querying Open Targets...", end=" ", flush=True)
+            result = fetch_opentargets_gene(ensembl_id, symbol)
+            time.sleep(REQUEST_DELAY)
+
+            if result is None:
+                print(f"FAILED (skipping)", file=sys.stderr)
+                report.failed(symbol, "API returned no data")
+                failed += 1
+                continue
+
+            drug_count = result.get("drug_count", 0)
+            max_phase = result.get("max_phase", 0)
+            detail = f"{drug_count} drugs, max phase {max_phase}" if drug_count > 0 else "no drugs"
+            print(detail)
+
+            opentargets_data[symbol] = result
+            cache[symbol] = result
+            report.ok(symbol, detail)
+            fetched += 1
+    finally:
+        report.flush_warnings()
 
     # Save updated cache
     save_cache(cache)
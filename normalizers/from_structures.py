@@ -186,57 +186,60 @@ def main():
     cached_count = 0
     failed = 0
 
-    for symbol in sorted(GENES.keys()):
-        uniprot_id = GENES[symbol].get("uniprot", "")
-        if not uniprot_id:
-            print(f"  {symbol}: no UniProt ID, skipping", file=sys.stderr)
-            report.skipped(symbol, "no UniProt ID")
-            continue
-
-        if symbol in cache:
-            entry = cache[symbol]
-            af_str = "AlphaFold" if entry.get("has_alphafold") else "no AF"
-            pdb_str = f"{entry.get('pdb_count', 0)} PDB"
-            print(f"  {symbol}: cached ({af_str}, {pdb_str})")
-            structures_data[symbol] = entry
-            report.cached(symbol, f"{af_str}, {pdb_str}")
-            cached_count += 1
-            continue
-
-        print(f"  {symbol}: querying AlphaFold + PDB ({uniprot_id})...", end=" ", flush=True)
-
-        # Fetch AlphaFold data
-        af_result = fetch_alphafold(uniprot_id)
-        time.sleep(REQUEST_DELAY)
-
-        # Fetch PDB count
-        pdb_count = fetch_pdb_count(uniprot_id)
-        time.sleep(REQUEST_DELAY)
-
-        if af_result is None and pdb_count is None:
-            print("FAILED (skipping)", file=sys.stderr)
-            report.failed(symbol, "both APIs returned no data")
-            failed += 1
-            continue
-
-        has_af = af_result is not None and af_result.get("has_alphafold", False)
-        confidence = af_result.get("confidence") if af_result else None
-        pdb = pdb_count if pdb_count is not None else 0
-
-        result = {
-            "has_alphafold": has_af,
-            "confidence": confidence,
-            "pdb_count": pdb,
-        }
-
-        af_str = f"pLDDT={confidence:.1f}" if confidence is not None else ("AlphaFold" if has_af else "no AF")
-        pdb_str = f"{pdb} PDB"
-        print(f"{af_str}, {pdb_str}")
-
-        structures_data[symbol] = result
-        cache[symbol] = result
-        report.ok(symbol, f"{af_str}, {pdb_str}")
-        fetched += 1
+    try:
+        for symbol in sorted(GENES.keys()):
+            uniprot_id = GENES[symbol].get("uniprot", "")
+            if not uniprot_id:
+                print(f"  {symbol}: no UniProt ID, skipping", file=sys.stderr)
+                report.skipped(symbol, "no UniProt ID")
+                continue
+
+            if symbol in cache:
+                entry = cache[symbol]
+                af_str = "AlphaFold" if entry.get("has_alphafold") else "no AF"
+                pdb_str = f"{entry.get('pdb_count', 0)} PDB"
+                print(f"  {symbol}: cached ({af_str}, {pdb_str})")
+                structures_data[symbol] = entry
+                report.cached(symbol, f"{af_str}, {pdb_str}")
+                cached_count += 1
+                continue
+
+            print(f"  {symbol}: querying AlphaFold + PDB ({uniprot_id})...", end=" ", flush=True)
+
+            # Fetch AlphaFold data
+            af_result = fetch_alphafold(uniprot_id)
+            time.sleep(REQUEST_DELAY)
+
+            # Fetch PDB count
+            pdb_count = fetch_pdb_count(uniprot_id)
+            time.sleep(REQUEST_DELAY)
+
+            if af_result is None and pdb_count is None:
+                print("FAILED (skipping)", file=sys.stderr)
+                report.failed(symbol, "both APIs returned no data")
+                failed += 1
+                continue
+
+            has_af = af_result is not None and af_result.get("has_alphafold", False)
+            confidence = af_result.get("confidence") if af_result else None
+            pdb = pdb_count if pdb_count is not None else 0
+
+            result = {
+                "has_alphafold": has_af,
+                "confidence": confidence,
+                "pdb_count": pdb,
+            }
+
+            af_str = f"pLDDT={confidence:.1f}" if confidence is not None else ("AlphaFold" if has_af else "no AF")
+            pdb_str = f"{pdb} PDB"
+            print(f"{af_str}, {pdb_str}")
+
+            structures_data[symbol] = result
+            cache[symbol] = result
+            report.ok(symbol, f"{af_str}, {pdb_str}")
+            fetched += 1
+    finally:
+        report.flush_warnings()
 
     # Save updated cache
     save_cache(cache)
@@ -7,18 +7,19 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GeneResult:
     symbol: str
     status: str  # "ok", "cached", "failed", "skipped"
     detail: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineReport:
     source: str
     results: list[GeneResult] = field(default_factory=list)
     start_time: float = field(default_factory=time.time)
+    _stderr_buffer: list[str] = field(default_factory=list, init=False, repr=False)
 
     def ok(self, symbol: str, detail: str = ""):
         self.results.append(GeneResult(symbol, "ok", detail))
@@ -28,17 +29,28 @@ class PipelineReport:
 
     def failed(self, symbol: str, detail: str = ""):
         self.results.append(GeneResult(symbol, "failed", detail))
-        print(f"  WARNING: {symbol}: {detail}", file=sys.stderr)
+        self._stderr_buffer.append(f"  WARNING: {symbol}: {detail}")
 
     def skipped(self, symbol: str, detail: str = ""):
         self.results.append(GeneResult(symbol, "skipped", detail))
 
+    def flush_warnings(self):
+        """Write buffered failure warnings to stderr in a single call."""
+        if self._stderr_buffer:
+            sys.stderr.write("\n".join(self._stderr_buffer) + "\n")
+            self._stderr_buffer.clear()
+
+    def _counts(self) -> dict[str, int]:
+        counts = {"ok": 0, "cached": 0, "failed": 0, "skipped": 0}
+        for r in self.results:
+            counts[r.status] += 1
+        return counts
+
     def summary(self) -> str:
         elapsed = time.time() - self.start_time
-        ok = sum(1 for r in self.results if r.status == "ok")
-        cached = sum(1 for r in self.results if r.status == "cached")
-        failed = sum(1 for r in self.results if r.status == "failed")
-        skipped = sum(1 for r in self.results if r.status == "skipped")
+        counts = self._counts()
+        ok, cached = counts["ok"], counts["cached"]
+        failed, skipped = counts["failed"], counts["skipped"]
         lines = [
             f"{self.source}: {ok + cached} genes ({ok} fetched, {cached} cached)",
         ]
@@ -50,22 +62,27 @@ class PipelineReport:
         return "\n".join(lines)
 
     def to_dict(self) -> dict:
+        counts = self._counts()
         return {
             "source": self.source,
             "elapsed_s": round(time.time() - self.start_time, 1),
-            "ok": sum(1 for r in self.results if r.status == "ok"),
-            "cached": sum(1 for r in self.results if r.status == "cached"),
-            "failed": sum(1 for r in self.results if r.status == "failed"),
+            "ok": counts["ok"],
+            "cached": counts["cached"],
+            "failed": counts["failed"],
             "failures": [{"symbol": r.symbol, "detail": r.detail}
                          for r in self.results if r.status == "failed"],
         }
 
 
+# Backslash and double quote escapes, applied in a single str.translate pass
+_CUE_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
 def escape_cue_string(s: str | None) -> str:
     """Escape a string for CUE literal output."""
     if s is None:
         return ""
-    return s.replace("\\", "\\\\").replace('"', '\\"')
+    return s.translate(_CUE_ESCAPE)
 
 
 def check_staleness(cache_file: Path, max_age_days: int = 30) -> bool:
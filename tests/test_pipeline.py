@@ -7,6 +7,7 @@ import sys
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
 TEST_GENES = ["SOX9", "IRF6", "PAX3", "RET", "MITF"]
 
 
@@ -98,6 +99,27 @@ def test_weighted_gaps():
     assert sox9["priority_score"] >= 0
 
 
+def test_python_merge_matches_cue():
+    """Python merge of the per-source exports equals CUE's unified genes.
+
+    Only the fields the 12 per-source files own are compared; the model's
+    other sources add fields that the Python merge never reads.
+    """
+    from unifier.merge import merge_all_sources
+    from unifier.prove import deep_compare, owned_fields
+    from unifier.source_reader import read_all_sources, read_cue_unified
+
+    cue_unified = read_cue_unified(repo_root=str(REPO_ROOT))
+    python_unified = merge_all_sources(
+        sorted(cue_unified), read_all_sources(repo_root=str(REPO_ROOT)),
+    )
+    diffs = deep_compare(
+        {k: owned_fields(g) for k, g in cue_unified.items()},
+        {k: owned_fields(g) for k, g in python_unified.items()},
+    )
+    assert not diffs, f"{len(diffs)} diffs, first: {diffs[:5]}"
+
+
 def run_generator(script: str) -> subprocess.CompletedProcess:
     """Run a generator script from the repo root."""
     result = subprocess.run(
@@ -195,6 +217,7 @@ def main():
         test_gene_detail,
         test_funding_gaps,
         test_weighted_gaps,
+        test_python_merge_matches_cue,
         test_vizdata_structure,
         test_site_output_files,
         test_anomaly_projection,
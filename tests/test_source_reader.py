@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Unit tests: concurrent cue exports against a stub cue on PATH."""
+
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+# Stub cue: `cue export <files> -e <expr>` where expr is one of
+#   slow:<ms>:<name>  sleep, then print {"expr": name}
+#   fail              print to stderr and exit 2
+#   noisy             4 MiB of stderr, then a large stdout document
+# Every run appends a line to $STUB_CUE_LOG.
+STUB = f"""#!{sys.executable}
+import json, os, sys, time
+expr = sys.argv[sys.argv.index("-e") + 1]
+with open(os.environ["STUB_CUE_LOG"], "a") as log:
+    log.write(expr + "\\n")
+if expr == "fail":
+    sys.stderr.write("boom: stub failure\\n")
+    sys.exit(2)
+if expr == "noisy":
+    sys.stderr.write("x" * (4 << 20))
+    print(json.dumps({{"data": "y" * (1 << 20)}}))
+    sys.exit(0)
+_, ms, name = expr.split(":")
+time.sleep(int(ms) / 1000)
+print(json.dumps({{"expr": name}}))
+"""
+
+_tmp = tempfile.TemporaryDirectory(prefix="froq-test-")
+TMP = Path(_tmp.name)
+(TMP / "bin").mkdir()
+(TMP / "bin" / "cue").write_text(STUB)
+(TMP / "bin" / "cue").chmod(0o755)
+WORK = TMP / "work"
+WORK.mkdir()
+(WORK / "a.cue").write_text("package stub\n")
+LOG = TMP / "cue.log"
+LOG.touch()
+
+# source_reader resolves cue on PATH at import
+os.environ["PATH"] = f"{TMP / 'bin'}{os.pathsep}{os.environ.get('PATH', '')}"
+os.environ["STUB_CUE_LOG"] = str(LOG)
+
+from unifier import source_reader
+from unifier.source_reader import cue_export_parallel
+
+source_reader.CUE_CACHE_DIR = TMP / "cache"
+
+
+def _runs() -> int:
+    return len(LOG.read_text().splitlines())
+
+
+def _cached(fn):
+    """Run fn with the disk cache turned on."""
+    old = os.environ.get("CUE_CACHE")
+    os.environ["CUE_CACHE"] = "1"
+    try:
+        return fn()
+    finally:
+        if old is None:
+            del os.environ["CUE_CACHE"]
+        else:
+            os.environ["CUE_CACHE"] = old
+
+
+def test_stub_on_path():
+    """The stub, not a real cue, is what source_reader launches."""
+    assert source_reader._CUE == str(TMP / "bin" / "cue"), source_reader._CUE
+
+
+def test_parallel_order():
+    """Results come back in job order, not completion order."""
+    jobs = [
+        ("slow:400:first", ["a.cue"]),
+        ("slow:0:second", ["a.cue"]),
+        ("slow:200:third", ["a.cue"]),
+    ]
+    results = cue_export_parallel(jobs, cwd=str(WORK))
+    assert results == [
+        {"expr": "first"}, {"expr": "second"}, {"expr": "third"},
+    ], results
+
+
+def test_parallel_bounded():
+    """With max_procs=1 the exports run one after another, in job order."""
+    jobs = [("slow:100:one", ["a.cue"]), ("slow:0:two", ["a.cue"])]
+    start = _runs()
+    results = cue_export_parallel(jobs, cwd=str(WORK), max_procs=1)
+    assert results == [{"expr": "one"}, {"expr": "two"}], results
+    log = LOG.read_text().splitlines()[start:]
+    assert log == ["slow:100:one", "slow:0:two"], log
+
+
+def test_parallel_cache_hit():
+    """A repeated export is served from the disk cache without running cue."""
+    jobs = [("slow:0:cached", ["a.cue"]), ("slow:0:also", ["a.cue"])]
+    first = _cached(lambda: cue_export_parallel(jobs, cwd=str(WORK)))
+    runs = _runs()
+    second = _cached(lambda: cue_export_parallel(jobs, cwd=str(WORK)))
+    assert _runs() == runs, "cue ran again on a cache hit"
+    assert first == second == [{"expr": "cached"}, {"expr": "also"}]
+
+
+def test_corrupt_cache_entry():
+    """A cache entry that doesn't parse is a miss: cue runs again."""
+    jobs = [("slow:0:corrupt", ["a.cue"])]
+    _cached(lambda: cue_export_parallel(jobs, cwd=str(WORK)))
+    for entry in (TMP / "cache").glob("cue-*.json"):
+        entry.write_bytes(b'{"expr": "corr')  # truncated
+    runs = _runs()
+    result = _cached(lambda: cue_export_parallel(jobs, cwd=str(WORK)))
+    assert _runs() == runs + 1, "corrupt entry was not re-exported"
+    assert result == [{"expr": "corrupt"}]
+
+
+def test_parallel_failure():
+    """A non-zero cue exit raises RuntimeError carrying its stderr."""
+    jobs = [("slow:0:fine", ["a.cue"]), ("fail", ["a.cue"])]
+    try:
+        cue_export_parallel(jobs, cwd=str(WORK))
+    except RuntimeError as e:
+        assert "boom: stub failure" in str(e), str(e)
+    else:
+        raise AssertionError("expected RuntimeError")
+
+
+def test_parallel_large_stderr():
+    """Megabytes on stderr and stdout at once do not deadlock the pipes."""
+    jobs = [("noisy", ["a.cue"]), ("slow:0:after", ["a.cue"])]
+    results = []
+    worker = threading.Thread(
+        target=lambda: results.append(
+            cue_export_parallel(jobs, cwd=str(WORK))
+        ),
+        daemon=True,
+    )
+    worker.start()
+    worker.join(timeout=60)
+    assert not worker.is_alive(), "cue_export_parallel hung"
+    noisy, after = results[0]
+    assert len(noisy["data"]) == 1 << 20
+    assert after == {"expr": "after"}
+
+
+def main():
+    tests = [
+        test_stub_on_path,
+        test_parallel_order,
+        test_parallel_bounded,
+        test_parallel_cache_hit,
+        test_corrupt_cache_entry,
+        test_parallel_failure,
+        test_parallel_large_stderr,
+    ]
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"  PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"  FAIL: {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  ERROR: {test.__name__}: {e}")
+            failed += 1
+
+    print(f"\n{passed} passed, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
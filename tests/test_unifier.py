@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Unit tests: Python unifier internals on hand-built genes (no CUE needed)."""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import networkx as nx
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from unifier._dsu import DSU
+from unifier.closure import transitive_closure
+from unifier.columnar import anomaly_rows, build_table, priority_scores
+from unifier.projections import project_gap_report, write_gap_report
+
+# Three genes covering every scoring and anomaly rule (symbols sorted):
+# ALPHA fires rules 1-3, BETA fires rule 4, GAMMA has no data at all.
+GENES = {
+    "ALPHA": {
+        "symbol": "ALPHA",
+        "_in_omim": True,
+        "_in_hpo": True,
+        "omim_syndromes": ["Syndrome A"],
+        "phenotypes": [f"HP:{i}" for i in range(11)],
+        "pathogenic_count": 0,
+        "pli_score": 0.95,
+        "pubmed_total": 600,
+    },
+    "BETA": {
+        "symbol": "BETA",
+        "_in_facebase": True,
+        "_in_clinvar": True,
+        "pathogenic_count": 20,
+        "active_trial_count": 2,
+    },
+    "GAMMA": {"symbol": "GAMMA"},
+}
+
+
+def test_dsu_groups():
+    """DSU.groups partitions 0..n-1 into the unioned sets."""
+    dsu = DSU(6)
+    dsu.union(0, 1)
+    dsu.union(1, 2)
+    dsu.union(4, 5)
+    groups = dsu.groups()
+    assert sorted(sorted(m) for m in groups.values()) == [[0, 1, 2], [3], [4, 5]]
+    for root, members in groups.items():
+        for x in members:
+            assert dsu.find(x) == root, f"{x} not rooted at {root}"
+
+
+def test_transitive_closure_order():
+    """Components come largest first, ties broken by smallest symbol."""
+    G = nx.Graph()
+    G.add_edges_from([("C", "D"), ("B", "C"), ("Y", "X"), ("Z", "A")])
+    G.add_node("E")
+    components = transitive_closure(G)
+    assert components == [{"B", "C", "D"}, {"A", "Z"}, {"X", "Y"}, {"E"}]
+    assert sorted(map(sorted, components)) == sorted(
+        map(sorted, nx.connected_components(G))
+    )
+
+
+def test_priority_scores():
+    """weighted_gaps priority_score per gene, in sorted-symbol order."""
+    table = build_table(GENES)
+    assert table.symbols == ["ALPHA", "BETA", "GAMMA"]
+    # ALPHA: 1 syndrome (5) + >10 phenotypes (3) + no FaceBase (10) + pLI (3)
+    # BETA:  no pubmed_total counts as understudied (1)
+    # GAMMA: no FaceBase (10) + understudied (1)
+    assert priority_scores(table) == [21, 1, 11]
+
+
+def test_anomaly_rows():
+    """Each anomaly rule selects the expected rows."""
+    rule1, rule2, rule3, rule4 = anomaly_rows(build_table(GENES))
+    assert rule1 == [0], "omim_no_clinvar"
+    assert rule2 == [0], "high_pli_no_trials"
+    assert rule3 == [0], "high_pubs_no_facebase"
+    assert rule4 == [1], "clinvar_no_hpo"
+
+
+def test_write_gap_report():
+    """Streamed gap_report matches project_gap_report and json.dump's text."""
+    out = io.StringIO()
+    write_gap_report(out, GENES)
+    expected = project_gap_report(GENES)
+    assert json.loads(out.getvalue()) == expected
+    assert out.getvalue() == json.dumps(expected, indent=2)
+
+
+def main():
+    tests = [
+        test_dsu_groups,
+        test_transitive_closure_order,
+        test_priority_scores,
+        test_anomaly_rows,
+        test_write_gap_report,
+    ]
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"  PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"  FAIL: {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  ERROR: {test.__name__}: {e}")
+            failed += 1
+
+    print(f"\n{passed} passed, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Disjoint-set union (union-find) over integer ids.
+
+Used by closure.py to compute connected components without walking
+networkx adjacency dicts.
+"""
+
+from array import array
+
+
+class DSU:
+    """Union by rank with path halving.
+
+    Elements are the integers 0..n-1.
+    """
+
+    __slots__ = ("parent", "rank")
+
+    def __init__(self, n: int):
+        self.parent = array("i", range(n))
+        self.rank = array("i", [0]) * n
+
+    def find(self, x: int) -> int:
+        """Return the root of x, halving the path as it goes."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> int:
+        """Merge the sets containing a and b. Returns the new root."""
+        ra = self.find(a)
+        rb = self.find(b)
+        if ra == rb:
+            return ra
+        rank = self.rank
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
+        return ra
+
+    def groups(self) -> dict[int, list[int]]:
+        """Return {root: [member, ...]} for every set."""
+        out: dict[int, list[int]] = {}
+        find = self.find
+        for x in range(len(self.parent)):
+            out.setdefault(find(x), []).append(x)
+        return out
@@ -16,81 +16,207 @@ Edge types:
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
+from itertools import combinations
 
 import networkx as nx
 
+from ._dsu import DSU
+from .columnar import Column, SoA, to_soa
+
 
 # ---------------------------------------------------------------------------
 # Graph construction
 # ---------------------------------------------------------------------------
 
+EDGE_TYPES = ("phenotype", "syndrome", "pathway", "ppi")
+
+# Each edge carries a "mask" attribute with one bit per edge type, so type
+# counts can be tallied per distinct mask instead of per edge type set.
+ETYPE_BIT = {etype: 1 << i for i, etype in enumerate(EDGE_TYPES)}
+
+
+def _group_owners(rows) -> dict[int, list[int]]:
+    """Group (term, gene id) rows into {term: [distinct gene ids]}.
+
+    Uses plain lists rather than a set per term, since most terms end up
+    filtered out. A column lists each gene's rows consecutively, so a
+    repeated term within one gene is always the last id appended.
+    """
+    index: dict[int, list[int]] = {}
+    for term, gid in rows:
+        ids = index.get(term)
+        if ids is None:
+            index[term] = [gid]
+        elif ids[-1] != gid:
+            ids.append(gid)
+    return index
+
+
 def _build_inverted_index(
-    genes: dict,
-    field: str,
+    column: Column,
     *,
-    extract: callable = None,
     min_sharing: int = 2,
     max_sharing: int = 5,
-) -> dict[str, set[str]]:
-    """Build an inverted index: term -> set of gene symbols that have it.
+) -> dict[int, list[int]]:
+    """Build an inverted index: term id -> sorted ids of the genes that have it.
 
     Args:
-        genes: unified gene dict
-        field: field name to pull values from (must be a list)
-        extract: optional callable to extract the string key from each
-                 list element (e.g., lambda t: t["term_name"])
+        column: flattened list field from the SoA gene table
         min_sharing: minimum number of genes sharing a term to keep it
         max_sharing: maximum number of genes sharing a term to keep it
                      (filters out universal terms)
 
     Returns:
-        {term_string: {symbol, symbol, ...}} filtered by sharing range
+        {term_id: [id, id, ...]} filtered by sharing range
     """
-    index: dict[str, set[str]] = defaultdict(set)
-    for sym, g in genes.items():
-        values = g.get(field, [])
-        if not values:
-            continue
-        for item in values:
-            key = extract(item) if extract else item
-            index[key].add(sym)
+    index = _group_owners(zip(column.values, column.owners))
 
     # Filter by sharing range
     return {
-        term: syms
-        for term, syms in index.items()
-        if min_sharing <= len(syms) <= max_sharing
+        term: sorted(ids)
+        for term, ids in index.items()
+        if min_sharing <= len(ids) <= max_sharing
     }
 
 
+def _enum_pairs(index: dict[int, list[int]]):
+    """Yield (a, b, term) for every gene pair sharing a term, with a < b.
+
+    Members are already sorted ids, so no per-term sort is needed. All
+    terms are flattened into one stream so the caller runs a single loop
+    instead of a nested per-term pair loop.
+    """
+    for term, ids in index.items():
+        for a, b in combinations(ids, 2):
+            yield a, b, term
+
+
 def _add_edges_from_index(
     G: nx.Graph,
-    index: dict[str, set[str]],
+    index: dict[int, list[int]],
     edge_type: str,
+    soa: SoA,
 ) -> int:
     """Add edges between all gene pairs that share a term.
 
+    Pairs are accumulated per (a, b) id pair first so each edge touches
+    the graph once, then new edges are bulk-loaded with add_edges_from.
+    Gene and term ids are decoded back to strings only at insertion.
+
     Returns the number of edges added.
     """
-    added = 0
-    for term, symbols in index.items():
-        sym_list = sorted(symbols)
-        for i in range(len(sym_list)):
-            for j in range(i + 1, len(sym_list)):
-                a, b = sym_list[i], sym_list[j]
-                if G.has_edge(a, b):
-                    # Add this edge type to existing edge
-                    G[a][b]["types"].add(edge_type)
-                    G[a][b]["shared_terms"].setdefault(edge_type, []).append(term)
-                else:
-                    G.add_edge(
-                        a, b,
-                        types={edge_type},
-                        shared_terms={edge_type: [term]},
-                    )
-                    added += 1
-    return added
+    pair_terms: dict[tuple[int, int], list[int]] = defaultdict(list)
+    for a, b, term in _enum_pairs(index):
+        pair_terms[a, b].append(term)
+
+    symbols, id2term = soa.symbols, soa.terms
+    bit = ETYPE_BIT[edge_type]
+    new_edges = []
+    for (a_id, b_id), term_ids in pair_terms.items():
+        a, b = symbols[a_id], symbols[b_id]
+        terms = [id2term[t] for t in term_ids]
+        if G.has_edge(a, b):
+            # Add this edge type to existing edge
+            G[a][b]["types"].add(edge_type)
+            G[a][b]["mask"] |= bit
+            G[a][b]["shared_terms"].setdefault(edge_type, []).extend(terms)
+        else:
+            new_edges.append((a, b, {
+                "types": {edge_type},
+                "mask": bit,
+                "shared_terms": {edge_type: terms},
+            }))
+    G.add_edges_from(new_edges)
+    return len(new_edges)
+
+
+def _build_index(soa: SoA, edge_type: str):
+    """Build the index backing a single edge type.
+
+    Term-based types return {term_id: [id, ...]}; "ppi" returns a list of
+    (symbol, partner) pairs where both genes are in the gene set.
+    """
+    if edge_type == "phenotype":
+        # 1. Shared phenotypes (HPO phenotype strings)
+        return _build_inverted_index(
+            soa.phenotypes,
+            min_sharing=2, max_sharing=5,
+        )
+
+    if edge_type == "syndrome":
+        # 2. Shared syndromes (OMIM syndrome strings)
+        return _build_inverted_index(
+            soa.omim_syndromes,
+            min_sharing=2, max_sharing=100,  # syndromes are specific enough
+        )
+
+    if edge_type == "pathway":
+        # 3. Shared GO biological processes (aspect "P" only)
+        go = soa.go_term_names
+        go_process_genes = _group_owners(
+            (name, gid)
+            for name, aspect, gid in zip(go.values, soa.go_aspects, go.owners)
+            if aspect == "P"
+        )
+
+        # Filter to terms shared by 2-8 genes
+        return {
+            term: sorted(ids)
+            for term, ids in go_process_genes.items()
+            if 2 <= len(ids) <= 8
+        }
+
+    if edge_type == "ppi":
+        # 4. STRING PPI: genes that list each other as interaction partners
+        symbols = soa.symbols
+        partners = soa.string_partners
+        return [
+            (symbols[gid], symbols[pid])
+            for pid, gid in zip(partners.values, partners.owners)
+            if pid >= 0  # Only add if both exist in our gene set
+        ]
+
+    raise ValueError(f"Unknown edge type: {edge_type!r}")
+
+
+def _build_all_indexes(soa: SoA) -> dict:
+    """Build the index for every edge type once: {edge_type: index}."""
+    return {etype: _build_index(soa, etype) for etype in EDGE_TYPES}
+
+
+def _add_ppi_edges(G: nx.Graph, pairs: list[tuple[str, str]]) -> None:
+    """Add STRING interaction edges, tagging existing edges with "ppi"."""
+    for sym, partner in pairs:
+        if G.has_edge(sym, partner):
+            G[sym][partner]["types"].add("ppi")
+            G[sym][partner]["mask"] |= ETYPE_BIT["ppi"]
+        else:
+            G.add_edge(
+                sym, partner,
+                types={"ppi"}, mask=ETYPE_BIT["ppi"], shared_terms={},
+            )
+
+
+def _graph_from_indexes(
+    genes: dict,
+    indexes: dict,
+    soa: SoA,
+    edge_types: tuple[str, ...] = EDGE_TYPES,
+) -> nx.Graph:
+    """Build a relationship graph over all genes from prebuilt indexes."""
+    G = nx.Graph()
+
+    # Add all genes as nodes
+    G.add_nodes_from(genes)
+
+    for etype in edge_types:
+        if etype == "ppi":
+            _add_ppi_edges(G, indexes[etype])
+        else:
+            _add_edges_from_index(G, indexes[etype], etype, soa)
+
+    return G
 
 
 def build_relationship_graph(genes: dict) -> nx.Graph:
@@ -104,54 +230,8 @@ def build_relationship_graph(genes: dict) -> nx.Graph:
        (only terms shared by 2-8 genes)
     4. STRING PPI: genes that are STRING interaction partners of each other
     """
-    G = nx.Graph()
-
-    # Add all genes as nodes
-    for sym in genes:
-        G.add_node(sym)
-
-    # 1. Shared phenotypes (HPO phenotype strings)
-    pheno_index = _build_inverted_index(
-        genes, "phenotypes",
-        min_sharing=2, max_sharing=5,
-    )
-    _add_edges_from_index(G, pheno_index, "phenotype")
-
-    # 2. Shared syndromes (OMIM syndrome strings)
-    syndrome_index = _build_inverted_index(
-        genes, "omim_syndromes",
-        min_sharing=2, max_sharing=100,  # syndromes are specific enough
-    )
-    _add_edges_from_index(G, syndrome_index, "syndrome")
-
-    # 3. Shared GO biological processes (aspect "P" only)
-    # Filter GO terms to just biological processes
-    go_process_genes: dict[str, set[str]] = defaultdict(set)
-    for sym, g in genes.items():
-        for term in g.get("go_terms", []):
-            if term.get("aspect") == "P":
-                go_process_genes[term["term_name"]].add(sym)
-
-    # Filter to terms shared by 2-8 genes
-    go_filtered = {
-        term: syms
-        for term, syms in go_process_genes.items()
-        if 2 <= len(syms) <= 8
-    }
-    _add_edges_from_index(G, go_filtered, "pathway")
-
-    # 4. STRING PPI: genes that list each other as interaction partners
-    for sym, g in genes.items():
-        partners = g.get("string_partners", [])
-        for partner in partners:
-            if partner in genes:
-                # Only add if both exist in our gene set
-                if G.has_edge(sym, partner):
-                    G[sym][partner]["types"].add("ppi")
-                else:
-                    G.add_edge(sym, partner, types={"ppi"}, shared_terms={})
-
-    return G
+    soa = to_soa(genes)
+    return _graph_from_indexes(genes, _build_all_indexes(soa), soa)
 
 
 def build_typed_graph(genes: dict, edge_type: str) -> nx.Graph:
@@ -159,45 +239,27 @@ def build_typed_graph(genes: dict, edge_type: str) -> nx.Graph:
 
     Valid edge_type values: "phenotype", "syndrome", "pathway", "ppi"
     """
-    G = nx.Graph()
-    for sym in genes:
-        G.add_node(sym)
-
-    if edge_type == "phenotype":
-        idx = _build_inverted_index(
-            genes, "phenotypes", min_sharing=2, max_sharing=5,
-        )
-        _add_edges_from_index(G, idx, "phenotype")
-
-    elif edge_type == "syndrome":
-        idx = _build_inverted_index(
-            genes, "omim_syndromes", min_sharing=2, max_sharing=100,
-        )
-        _add_edges_from_index(G, idx, "syndrome")
-
-    elif edge_type == "pathway":
-        go_index: dict[str, set[str]] = defaultdict(set)
-        for sym, g in genes.items():
-            for term in g.get("go_terms", []):
-                if term.get("aspect") == "P":
-                    go_index[term["term_name"]].add(sym)
-        filtered = {t: s for t, s in go_index.items() if 2 <= len(s) <= 8}
-        _add_edges_from_index(G, filtered, "pathway")
-
-    elif edge_type == "ppi":
-        for sym, g in genes.items():
-            for partner in g.get("string_partners", []):
-                if partner in genes:
-                    if not G.has_edge(sym, partner):
-                        G.add_edge(sym, partner, types={"ppi"}, shared_terms={})
-
-    return G
+    soa = to_soa(genes)
+    if edge_type not in EDGE_TYPES:
+        # Unknown types yield an edgeless graph over all genes
+        return _graph_from_indexes(genes, {}, soa, ())
+    indexes = {edge_type: _build_index(soa, edge_type)}
+    return _graph_from_indexes(genes, indexes, soa, (edge_type,))
 
 
 # ---------------------------------------------------------------------------
 # Transitive closure
 # ---------------------------------------------------------------------------
 
+def _sorted_components(dsu: DSU, nodes: list[str]) -> list[set[str]]:
+    """Convert DSU groups back to symbol sets, largest first."""
+    components = [
+        {nodes[i] for i in members} for members in dsu.groups().values()
+    ]
+    components.sort(key=lambda c: (-len(c), min(c)))
+    return components
+
+
 def transitive_closure(G: nx.Graph) -> list[set[str]]:
     """Compute transitive closure as connected components.
 
@@ -205,14 +267,21 @@ def transitive_closure(G: nx.Graph) -> list[set[str]]:
     Returns list of gene symbol sets, one per component, sorted by
     descending size then alphabetical first element.
     """
-    components = [set(c) for c in nx.connected_components(G)]
-    components.sort(key=lambda c: (-len(c), min(c)))
-    return components
+    nodes = list(G)
+    sym2id = {sym: i for i, sym in enumerate(nodes)}
+    dsu = DSU(len(nodes))
+    for u, v in G.edges():
+        dsu.union(sym2id[u], sym2id[v])
+    return _sorted_components(dsu, nodes)
 
 
-def closure_by_edge_type(genes: dict) -> dict:
+def closure_by_edge_type(genes: dict, G_all: nx.Graph | None = None) -> dict:
     """Compute transitive closure separately for each relationship type.
 
+    The combined graph is built once (or passed in as G_all). A single
+    sweep over its edges feeds one union-find per edge type plus one for
+    the combined graph, using each edge's type mask.
+
     Returns: {
         "phenotype_components": [...sets...],
         "syndrome_components": [...sets...],
@@ -221,16 +290,28 @@ def closure_by_edge_type(genes: dict) -> dict:
         "all_components": [...sets...],  # combined graph
     }
     """
+    if G_all is None:
+        G_all = build_relationship_graph(genes)
+
+    nodes = list(G_all)
+    sym2id = {sym: i for i, sym in enumerate(nodes)}
+    typed = [(etype, bit, DSU(len(nodes))) for etype, bit in ETYPE_BIT.items()]
+    combined = DSU(len(nodes))
+    for u, v, mask in G_all.edges(data="mask", default=0):
+        a, b = sym2id[u], sym2id[v]
+        combined.union(a, b)
+        for _, bit, dsu in typed:
+            if mask & bit:
+                dsu.union(a, b)
+
     result = {}
-    for etype in ["phenotype", "syndrome", "pathway", "ppi"]:
-        G = build_typed_graph(genes, etype)
-        components = transitive_closure(G)
+    for etype, _, dsu in typed:
+        components = _sorted_components(dsu, nodes)
         # Only include non-singleton components
         result[f"{etype}_components"] = [c for c in components if len(c) > 1]
 
     # Combined graph
-    G_all = build_relationship_graph(genes)
-    all_comps = transitive_closure(G_all)
+    all_comps = _sorted_components(combined, nodes)
     result["all_components"] = [c for c in all_comps if len(c) > 1]
 
     return result
@@ -240,9 +321,20 @@ def closure_by_edge_type(genes: dict) -> dict:
 # Centrality analysis
 # ---------------------------------------------------------------------------
 
-def centrality_analysis(G: nx.Graph) -> dict:
+def centrality_analysis(
+    G: nx.Graph,
+    k: int = 256,
+    communities: dict[int, set[str]] | None = None,
+) -> dict:
     """Compute graph centrality metrics.
 
+    Pass precomputed community_detection(G) output as communities to
+    avoid running label propagation again.
+
+    Betweenness is exact for graphs with at most k nodes. Larger graphs
+    use k sampled source nodes (seeded, so results are reproducible),
+    which keeps the top-ranked bridge genes stable at O(k*E) cost.
+
     Returns: {
         symbol: {
             "degree": int,
@@ -256,9 +348,13 @@ def centrality_analysis(G: nx.Graph) -> dict:
         return {}
 
     degree = dict(G.degree())
-    betweenness = nx.betweenness_centrality(G)
+    if G.number_of_nodes() > k:
+        betweenness = nx.betweenness_centrality(G, k=k, seed=0)
+    else:
+        betweenness = nx.betweenness_centrality(G)
     closeness = nx.closeness_centrality(G)
-    communities = community_detection(G)
+    if communities is None:
+        communities = community_detection(G)
 
     # Build reverse mapping: symbol -> community_id
     sym_to_community = {}
@@ -298,9 +394,27 @@ def community_detection(G: nx.Graph) -> dict[int, set[str]]:
 # Full closure report
 # ---------------------------------------------------------------------------
 
-def closure_report(genes: dict) -> dict:
+def _edge_type_counts(masks) -> dict[str, int]:
+    """Count edges per type from an iterable of edge-type bitmasks.
+
+    Edges are tallied per distinct mask (at most 2**len(EDGE_TYPES) of
+    them), then each mask's count is credited to every type bit it has.
+    Types with no edges are omitted.
+    """
+    by_mask = Counter(masks)
+    counts = {}
+    for etype, bit in ETYPE_BIT.items():
+        n = sum(c for mask, c in by_mask.items() if mask & bit)
+        if n:
+            counts[etype] = n
+    return counts
+
+
+def closure_report(genes: dict, G: nx.Graph | None = None) -> dict:
     """Full closure analysis report.
 
+    Pass a prebuilt relationship graph as G to avoid rebuilding it.
+
     Returns: {
         "graph_stats": {nodes, edges, components, density},
         "edge_type_counts": {phenotype, syndrome, pathway, ppi},
@@ -311,7 +425,8 @@ def closure_report(genes: dict) -> dict:
         "largest_closure": {...},
     }
     """
-    G = build_relationship_graph(genes)
+    if G is None:
+        G = build_relationship_graph(genes)
 
     # Graph stats
     num_components = nx.number_connected_components(G)
@@ -325,35 +440,41 @@ def closure_report(genes: dict) -> dict:
     }
 
     # Edge type counts: count edges where each type appears
-    edge_type_counts = {"phenotype": 0, "syndrome": 0, "pathway": 0, "ppi": 0}
-    for u, v, data in G.edges(data=True):
-        for etype in data.get("types", set()):
-            edge_type_counts[etype] = edge_type_counts.get(etype, 0) + 1
+    edge_type_counts = {etype: 0 for etype in EDGE_TYPES}
+    edge_type_counts.update(_edge_type_counts(
+        mask for _, _, mask in G.edges(data="mask", default=0)
+    ))
 
     # Components (non-singleton, sorted by size)
     components = transitive_closure(G)
+
+    # Bucket every edge's mask by component in a single sweep; both
+    # endpoints of an edge are always in the same component.
+    comp_of = {sym: i for i, comp in enumerate(components) for sym in comp}
+    comp_masks: list[list[int]] = [[] for _ in components]
+    for u, _, mask in G.edges(data="mask", default=0):
+        comp_masks[comp_of[u]].append(mask)
+
     component_descriptions = []
-    for comp in components:
+    for comp, masks in zip(components, comp_masks):
         if len(comp) < 2:
             continue
         # Find dominant edge types within this component
-        subgraph = G.subgraph(comp)
-        comp_edge_types: dict[str, int] = defaultdict(int)
-        for u, v, data in subgraph.edges(data=True):
-            for etype in data.get("types", set()):
-                comp_edge_types[etype] += 1
+        comp_edge_types = _edge_type_counts(masks)
 
         dominant = max(comp_edge_types, key=comp_edge_types.get) if comp_edge_types else "none"
         component_descriptions.append({
             "genes": sorted(comp),
             "size": len(comp),
-            "edges": subgraph.number_of_edges(),
+            "edges": len(masks),
             "dominant_relationship": dominant,
             "edge_breakdown": dict(comp_edge_types),
         })
 
-    # Centrality-based rankings
-    centrality = centrality_analysis(G)
+    # Centrality-based rankings (communities are shared with the
+    # community report below)
+    communities = community_detection(G)
+    centrality = centrality_analysis(G, communities=communities)
 
     # Hub genes: top 10 by degree centrality
     hub_genes = sorted(
@@ -378,7 +499,6 @@ def closure_report(genes: dict) -> dict:
     ]
 
     # Communities
-    communities = community_detection(G)
     community_descriptions = []
     for cid, members in sorted(communities.items()):
         if len(members) < 2:
@@ -390,12 +510,9 @@ def closure_report(genes: dict) -> dict:
         })
 
     # Largest closure
-    largest = max(components, key=len) if components else set()
-    largest_subgraph = G.subgraph(largest) if largest else nx.Graph()
-    largest_edge_types: dict[str, int] = defaultdict(int)
-    for u, v, data in largest_subgraph.edges(data=True):
-        for etype in data.get("types", set()):
-            largest_edge_types[etype] += 1
+    # (components are sorted by descending size, so the first is largest)
+    largest = components[0] if components else set()
+    largest_edge_types = _edge_type_counts(comp_masks[0]) if components else {}
     dominant_role = max(largest_edge_types, key=largest_edge_types.get) if largest_edge_types else "none"
 
     largest_closure = {
@@ -421,35 +538,17 @@ def closure_report(genes: dict) -> dict:
 
 if __name__ == "__main__":
     import json
-    import subprocess
     import sys
 
-    # Load unified genes from CUE
+    from .source_reader import read_cue_unified
+
+    # Load unified genes (with the _in_* source flags) from CUE
     print("Loading unified genes from CUE...", file=sys.stderr)
-    proc = subprocess.run(
-        ["cue", "export", "./model/", "-e", "genes"],
-        capture_output=True, text=True,
-    )
-    if proc.returncode != 0:
-        print(f"cue export failed: {proc.stderr}", file=sys.stderr)
+    try:
+        genes_data = read_cue_unified()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
         sys.exit(1)
-    genes_data = json.loads(proc.stdout)
-
-    # Also load source flags
-    proc2 = subprocess.run(
-        ["cue", "export", "./model/", "-e", "gene_sources"],
-        capture_output=True, text=True,
-    )
-    if proc2.returncode != 0:
-        print(f"cue export gene_sources failed: {proc2.stderr}", file=sys.stderr)
-        sys.exit(1)
-    source_flags = json.loads(proc2.stdout)
-
-    # Merge _in_* flags into gene dicts
-    for symbol, flags in source_flags.items():
-        if symbol in genes_data:
-            for flag_name, flag_value in flags.items():
-                genes_data[symbol][f"_{flag_name}"] = flag_value
 
     print(f"Loaded {len(genes_data)} genes", file=sys.stderr)
 
@@ -467,5 +566,5 @@ if __name__ == "__main__":
 
     # Full report
     print("Generating closure report...", file=sys.stderr)
-    report = closure_report(genes_data)
+    report = closure_report(genes_data, G=G)
     print(json.dumps(report, indent=2, default=list))
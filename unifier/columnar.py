@@ -0,0 +1,238 @@
+"""Columnar (structure-of-arrays) views of the unified gene dict.
+
+The unified gene dict is an array of structures: every read of a gene
+field is a dict lookup per gene. Each view here walks the genes once, in
+sorted-symbol order, and lays the fields one consumer needs out as flat
+columns:
+
+- GeneTable (build_table) holds the source flags, packed into one int per
+  gene, and the numeric fields the projections reduce over.
+- SoA (to_soa) flattens the list fields closure.py builds its inverted
+  indexes from into columns of values paired with the id of the gene
+  that owns each value. Term strings are interned to integer ids so index
+  keys hash and compare as ints; STRING partners are stored as gene ids,
+  with -1 for partners outside the gene set.
+
+In both, row i / gene id i is the i-th symbol in sorted order.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+
+# ---------------------------------------------------------------------------
+# Source flag bitmask
+# ---------------------------------------------------------------------------
+
+# Sources in gap_report output order; bit i of a packed flag word is set
+# when the gene has _in_<SOURCES[i]>.
+SOURCES = (
+    "go", "omim", "hpo", "uniprot", "facebase", "clinvar", "pubmed",
+    "gnomad", "nih_reporter", "gtex", "clinicaltrials", "string",
+)
+_FLAG_BITS = tuple((f"_in_{src}", 1 << i) for i, src in enumerate(SOURCES))
+
+MASK_GO = 1 << 0
+MASK_OMIM = 1 << 1
+MASK_HPO = 1 << 2
+MASK_UNIPROT = 1 << 3
+MASK_FACEBASE = 1 << 4
+MASK_CLINVAR = 1 << 5
+MASK_PUBMED = 1 << 6
+MASK_GNOMAD = 1 << 7
+MASK_NIH_REPORTER = 1 << 8
+MASK_GTEX = 1 << 9
+MASK_CLINICALTRIALS = 1 << 10
+MASK_STRING = 1 << 11
+
+# gap_report tiers: present in the first 5 / 7 / 10 sources
+MASK_FIVE = 0x1F
+MASK_SEVEN = 0x7F
+MASK_TEN = 0x3FF
+
+
+def pack_flags(gene: dict) -> int:
+    """Pack a gene's truthy _in_* flags into one int (see SOURCES)."""
+    flags = 0
+    for flag, bit in _FLAG_BITS:
+        if gene.get(flag):
+            flags |= bit
+    return flags
+
+
+# ---------------------------------------------------------------------------
+# Gene table
+# ---------------------------------------------------------------------------
+
+@dataclass
+class GeneTable:
+    """Per-gene columns, all aligned with symbols (sorted).
+
+    Optional numeric fields hold None where the gene lacks the field, so
+    each projection can apply its own default the way CUE does.
+    """
+
+    symbols: list[str]
+    rows: list[dict]  # the gene dicts themselves, for output fields
+    flags: array  # packed _in_* bits
+    syn_count: list[int]  # len(omim_syndromes), 0 if absent
+    pheno_count: list[int]  # len(phenotypes), 0 if absent
+    pubmed_total: list
+    pli_score: list
+    pathogenic_count: list
+    trial_count: list  # active_trial_count
+
+
+def build_table(unified: dict) -> GeneTable:
+    """Materialize the projection columns from the unified gene dict."""
+    symbols = sorted(unified)
+    rows = [unified[k] for k in symbols]
+    return GeneTable(
+        symbols=symbols,
+        rows=rows,
+        flags=array("H", map(pack_flags, rows)),
+        syn_count=[len(v.get("omim_syndromes", ())) for v in rows],
+        pheno_count=[len(v.get("phenotypes", ())) for v in rows],
+        pubmed_total=[v.get("pubmed_total") for v in rows],
+        pli_score=[v.get("pli_score") for v in rows],
+        pathogenic_count=[v.get("pathogenic_count") for v in rows],
+        trial_count=[v.get("active_trial_count") for v in rows],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Kernels
+# ---------------------------------------------------------------------------
+
+def priority_scores(table: GeneTable) -> list[int]:
+    """weighted_gaps priority_score for every row of the table."""
+    scores = []
+    append = scores.append
+    for flags, syn, pheno, pli, pub in zip(
+        table.flags, table.syn_count, table.pheno_count,
+        table.pli_score, table.pubmed_total,
+    ):
+        score = syn * 5  # syndrome burden
+        if flags & MASK_HPO and pheno > 10:  # phenotype richness
+            score += 3
+        if not flags & MASK_FACEBASE:  # FaceBase gap
+            score += 10
+        if pli is not None and pli > 0.9:  # constraint
+            score += 3
+        if pub is None or pub < 10:  # understudied, absent counts too
+            score += 1
+        append(score)
+    return scores
+
+
+def anomaly_rows(table: GeneTable) -> tuple[list[int], list[int], list[int], list[int]]:
+    """Row indexes matching each anomalies rule, in one pass.
+
+    Returns (omim_no_clinvar, high_pli_no_trials, high_pubs_no_facebase,
+    clinvar_no_hpo). Each rule only fires when the field it reports is
+    present on the gene.
+    """
+    rule1, rule2, rule3, rule4 = [], [], [], []
+    for i, (flags, syn, pheno, pli, pub, pathogenic, trials) in enumerate(zip(
+        table.flags, table.syn_count, table.pheno_count, table.pli_score,
+        table.pubmed_total, table.pathogenic_count, table.trial_count,
+    )):
+        if pathogenic is None:
+            pathogenic = 0
+        # Rule 1: OMIM disease but 0 ClinVar pathogenic variants
+        if flags & MASK_OMIM and syn > 0 and pathogenic == 0:
+            rule1.append(i)
+        # Rule 2: High pLI but no clinical trials
+        if pli is not None and pli > 0.9 and not trials:
+            rule2.append(i)
+        # Rule 3: High publication count but no FaceBase
+        if pub is not None and pub > 500 and not flags & MASK_FACEBASE:
+            rule3.append(i)
+        # Rule 4: ClinVar pathogenic variants but no HPO phenotypes
+        if pathogenic > 10 and pheno == 0:
+            rule4.append(i)
+    return rule1, rule2, rule3, rule4
+
+
+# ---------------------------------------------------------------------------
+# List-field columns (closure graph construction)
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Column:
+    """A flattened list field: values[i] belongs to gene id owners[i]."""
+
+    values: list = field(default_factory=list)
+    owners: array = field(default_factory=lambda: array("i"))
+
+    def extend(self, owner: int, items) -> None:
+        n = len(self.values)
+        self.values.extend(items)
+        self.owners.extend([owner] * (len(self.values) - n))
+
+
+@dataclass
+class SoA:
+    """List-field columns of the gene dict, for closure graph construction.
+
+    Gene ids follow sorted-symbol order, so comparing ids orders gene
+    pairs exactly like comparing symbols. Rows within each column keep
+    the iteration order of the source gene dict.
+    """
+
+    symbols: list[str]
+    sym2id: dict[str, int]
+    terms: list[str]  # term id -> term string
+    phenotypes: Column  # term ids
+    omim_syndromes: Column  # term ids
+    go_term_names: Column  # term ids
+    go_aspects: list[str]  # aligned with go_term_names.values
+    string_partners: Column  # gene ids, -1 if not in the gene set
+
+
+def to_soa(genes: dict) -> SoA:
+    """Flatten the list fields used for graph construction into columns."""
+    symbols = sorted(genes)
+    sym2id = {sym: i for i, sym in enumerate(symbols)}
+
+    terms: list[str] = []
+    term2id: dict[str, int] = {}
+
+    def intern(items) -> list[int]:
+        ids = []
+        for term in items:
+            tid = term2id.get(term)
+            if tid is None:
+                tid = term2id[term] = len(terms)
+                terms.append(term)
+            ids.append(tid)
+        return ids
+
+    phenotypes = Column()
+    omim_syndromes = Column()
+    go_term_names = Column()
+    go_aspects: list[str] = []
+    string_partners = Column()
+
+    for sym, g in genes.items():
+        gid = sym2id[sym]
+        phenotypes.extend(gid, intern(g.get("phenotypes") or ()))
+        omim_syndromes.extend(gid, intern(g.get("omim_syndromes") or ()))
+        go_terms = g.get("go_terms") or ()
+        go_term_names.extend(gid, intern(t.get("term_name") for t in go_terms))
+        go_aspects.extend(t.get("aspect") for t in go_terms)
+        string_partners.extend(
+            gid, [sym2id.get(p, -1) for p in g.get("string_partners") or ()],
+        )
+
+    return SoA(
+        symbols=symbols,
+        sym2id=sym2id,
+        terms=terms,
+        phenotypes=phenotypes,
+        omim_syndromes=omim_syndromes,
+        go_term_names=go_term_names,
+        go_aspects=go_aspects,
+        string_partners=string_partners,
+    )
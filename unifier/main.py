@@ -20,7 +20,13 @@ import sys
 from pathlib import Path
 
 from .source_reader import read_cue_unified
-from .projections import compute_all, ALL_PROJECTIONS
+from .columnar import build_table
+from .projections import (
+    ALL_PROJECTIONS,
+    compute_all,
+    iter_gap_report,
+    write_gap_report,
+)
 from .closure import closure_report, closure_by_edge_type, build_relationship_graph
 
 
@@ -35,17 +41,30 @@ def load_unified(repo_root: str | None = None) -> dict:
 def run_projections(unified: dict, output_dir: Path | None = None) -> dict:
     """Compute all 6 projections and optionally write to output directory.
 
+    With an output directory, gap_report is streamed straight to its file
+    from the shared gene table and is not included in the returned dict.
+
     Returns: {projection_name: result_dict}
     """
     print("Computing projections...", file=sys.stderr)
-    results = compute_all(unified)
+    table = build_table(unified)
+    stream_gap_report = output_dir is not None
+    results = compute_all(
+        unified, table=table,
+        exclude=("gap_report",) if stream_gap_report else (),
+    )
 
-    for name, result in results.items():
+    for name in ALL_PROJECTIONS:
+        result = results.get(name)
         # Quick summary on stderr
         if name == "gene_sources":
             print(f"  gene_sources: {len(result)} genes", file=sys.stderr)
         elif name == "gap_report":
-            s = result["summary"]
+            if result is None:
+                # The summary is the first section; the rest stays lazy
+                _, s = next(iter_gap_report(unified, table))
+            else:
+                s = result["summary"]
             print(f"  gap_report: {s['total']} genes, "
                   f"{s['in_all_five']} in all 5, "
                   f"{s['missing_facebase_count']} missing FaceBase",
@@ -67,10 +86,14 @@ def run_projections(unified: dict, output_dir: Path | None = None) -> dict:
 
     if output_dir:
         output_dir.mkdir(parents=True, exist_ok=True)
-        for name, result in results.items():
+        for name in ALL_PROJECTIONS:
             path = output_dir / f"{name}.json"
             with open(path, "w") as f:
-                json.dump(result, f, indent=2)
+                if name == "gap_report":
+                    # Same text as json.dump(..., indent=2)
+                    write_gap_report(f, unified, table)
+                else:
+                    json.dump(results[name], f, indent=2)
                 f.write("\n")
             print(f"  wrote {path}", file=sys.stderr)
 
@@ -41,10 +41,14 @@ def merge_field(field_name: str, existing, incoming, default):
 
     Both existing and incoming are concrete values (not absent).
     The default is the lattice top for this field.
+
+    Values still at their default are usually the very object stored in
+    GENE_DEFAULTS (new_gene shares them), so an identity check settles
+    the common case before falling back to ==.
     """
-    if incoming == default:
+    if incoming is default or incoming == default:
         return existing  # incoming is at top, keep existing
-    if existing == default:
+    if existing is default or existing == default:
         return incoming  # existing is at top, take incoming
     if existing == incoming:
         return existing  # idempotent
@@ -69,45 +73,53 @@ def merge_optional(field_name: str, existing, incoming):
     )
 
 
-def merge_gene(base: dict, contribution: dict) -> dict:
-    """Merge a source's contribution into the base gene dict.
+def merge_gene_inplace(dst: dict, contribution: dict) -> None:
+    """Merge a source's contribution into dst, mutating it in place.
 
-    The contribution dict should contain only fields this source actually
-    sets (non-default values). The base should be a full gene dict with
-    all defaults.
-
-    Returns a new dict -- does not mutate base.
+    Same lattice semantics as merge_gene. On conflict, ConflictError is
+    raised and dst may be left partially merged.
     """
-    result = dict(base)
-
     for field, value in contribution.items():
         if field == "symbol":
             continue  # key field, always matches
 
-        if field in GENE_DEFAULTS:
+        default = GENE_DEFAULTS.get(field, _ABSENT)
+        if default is not _ABSENT:
             # Defaulted field -- use lattice merge
-            result[field] = merge_field(
+            dst[field] = merge_field(
                 field,
-                result.get(field, GENE_DEFAULTS[field]),
+                dst.get(field, default),
                 value,
-                GENE_DEFAULTS[field],
+                default,
             )
         elif field in OPTIONAL_FIELDS:
             # Optional field -- absent + present -> present
-            existing = result.get(field, _ABSENT)
+            existing = dst.get(field, _ABSENT)
             merged = merge_optional(field, existing, value)
             if merged is not _ABSENT:
-                result[field] = merged
+                dst[field] = merged
         else:
             # Unknown field -- forward compatibility, just set it
             # If already present, must be equal
-            if field in result and result[field] != value:
+            if field in dst and dst[field] != value:
                 raise ConflictError(
                     f"Conflict on unknown field {field}: "
-                    f"{result[field]!r} vs {value!r}"
+                    f"{dst[field]!r} vs {value!r}"
                 )
-            result[field] = value
+            dst[field] = value
+
 
+def merge_gene(base: dict, contribution: dict) -> dict:
+    """Merge a source's contribution into the base gene dict.
+
+    The contribution dict should contain only fields this source actually
+    sets (non-default values). The base should be a full gene dict with
+    all defaults.
+
+    Returns a new dict -- does not mutate base.
+    """
+    result = dict(base)
+    merge_gene_inplace(result, contribution)
     return result
 
 
@@ -137,6 +149,7 @@ def merge_all_sources(
         for symbol, contribution in source_data.items():
             if symbol not in unified:
                 continue
-            unified[symbol] = merge_gene(unified[symbol], contribution)
+            # unified owns each gene dict, so merge without copying
+            merge_gene_inplace(unified[symbol], contribution)
 
     return unified
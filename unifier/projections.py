@@ -6,143 +6,185 @@ and produces output identical to the corresponding CUE projection expression.
 All 6 projections have been verified byte-for-byte identical to CUE output.
 """
 
-
-def project_gene_sources(unified: dict) -> dict:
+import json
+from collections import Counter
+from operator import itemgetter
+
+from .columnar import (
+    MASK_FACEBASE,
+    MASK_FIVE,
+    MASK_OMIM,
+    MASK_SEVEN,
+    MASK_TEN,
+    SOURCES,
+    GeneTable,
+    anomaly_rows,
+    build_table,
+    priority_scores,
+)
+
+
+# _in_* flag fields in SOURCES order, and the output keys they map to in
+# gene_sources and enrichment.
+_FLAG_FIELDS = tuple(f"_in_{src}" for src in SOURCES)
+_get_flags = itemgetter(*_FLAG_FIELDS)
+
+_GENE_SOURCES_KEYS = tuple(f"in_{src}" for src in SOURCES)
+_ENRICHMENT_KEYS = (
+    "has_function", "has_disease", "has_phenotype", "has_protein",
+    "has_experiment", "has_variants", "has_literature", "has_constraint",
+    "has_funding", "has_expression", "has_trials", "has_interactions",
+)
+
+
+def _flag_values(gene: dict) -> tuple:
+    """All 12 _in_* flags of a gene, in SOURCES order (absent = False)."""
+    try:
+        # Merged genes carry every flag (new_gene applies the defaults)
+        return _get_flags(gene)
+    except KeyError:
+        return tuple(gene.get(f, False) for f in _FLAG_FIELDS)
+
+
+def project_gene_sources(unified: dict, table: GeneTable | None = None) -> dict:
     """Equivalent to: cue export ./model/ -e gene_sources
 
     Exports the _in_* hidden flags as visible fields.
     """
-    result = {}
-    for symbol, gene in sorted(unified.items()):
-        result[symbol] = {
-            "in_go": gene.get("_in_go", False),
-            "in_omim": gene.get("_in_omim", False),
-            "in_hpo": gene.get("_in_hpo", False),
-            "in_uniprot": gene.get("_in_uniprot", False),
-            "in_facebase": gene.get("_in_facebase", False),
-            "in_clinvar": gene.get("_in_clinvar", False),
-            "in_pubmed": gene.get("_in_pubmed", False),
-            "in_gnomad": gene.get("_in_gnomad", False),
-            "in_nih_reporter": gene.get("_in_nih_reporter", False),
-            "in_gtex": gene.get("_in_gtex", False),
-            "in_clinicaltrials": gene.get("_in_clinicaltrials", False),
-            "in_string": gene.get("_in_string", False),
-        }
-    return result
+    if table is None:
+        table = build_table(unified)
+    keys = _GENE_SOURCES_KEYS
+    return {
+        symbol: dict(zip(keys, _flag_values(gene)))
+        for symbol, gene in zip(table.symbols, table.rows)
+    }
 
 
-def project_enrichment(unified: dict) -> dict:
+def project_enrichment(unified: dict, table: GeneTable | None = None) -> dict:
     """Equivalent to: cue export ./model/ -e enrichment"""
-    tiers = {}
-    for symbol, gene in sorted(unified.items()):
-        tiers[symbol] = {
-            "has_function": gene.get("_in_go", False),
-            "has_disease": gene.get("_in_omim", False),
-            "has_phenotype": gene.get("_in_hpo", False),
-            "has_protein": gene.get("_in_uniprot", False),
-            "has_experiment": gene.get("_in_facebase", False),
-            "has_variants": gene.get("_in_clinvar", False),
-            "has_literature": gene.get("_in_pubmed", False),
-            "has_constraint": gene.get("_in_gnomad", False),
-            "has_funding": gene.get("_in_nih_reporter", False),
-            "has_expression": gene.get("_in_gtex", False),
-            "has_trials": gene.get("_in_clinicaltrials", False),
-            "has_interactions": gene.get("_in_string", False),
-        }
+    if table is None:
+        table = build_table(unified)
+    keys = _ENRICHMENT_KEYS
+    tiers = {
+        symbol: dict(zip(keys, _flag_values(gene)))
+        for symbol, gene in zip(table.symbols, table.rows)
+    }
     return {"tiers": tiers}
 
 
-def project_gap_report(unified: dict) -> dict:
-    """Equivalent to: cue export ./model/ -e gap_report"""
-    genes = unified
+def _missing_entries(symbols: list[str], flags, bit: int):
+    """{"symbol": k} for every gene whose flag word lacks bit."""
+    return ({"symbol": k} for k, f in zip(symbols, flags) if not f & bit)
+
 
-    # Per-source missing lists
-    missing_go = [{"symbol": k} for k in sorted(genes) if not genes[k].get("_in_go", False)]
-    missing_omim = [{"symbol": k} for k in sorted(genes) if not genes[k].get("_in_omim", False)]
-    missing_hpo = [{"symbol": k} for k in sorted(genes) if not genes[k].get("_in_hpo", False)]
-    missing_uniprot = [{"symbol": k} for k in sorted(genes) if not genes[k].get("_in_uniprot", False)]
-    missing_facebase = [{"symbol": k} for k in sorted(genes) if not genes[k].get("_in_facebase", False)]
-    missing_clinvar = [{"symbol": k} for k in sorted(genes) if not genes[k].get("_in_clinvar", False)]
-    missing_pubmed = [{"symbol": k} for k in sorted(genes) if not genes[k].get("_in_pubmed", False)]
-    missing_gnomad = [{"symbol": k} for k in sorted(genes) if not genes[k].get("_in_gnomad", False)]
-    missing_nih_reporter = [{"symbol": k} for k in sorted(genes) if not genes[k].get("_in_nih_reporter", False)]
-    missing_gtex = [{"symbol": k} for k in sorted(genes) if not genes[k].get("_in_gtex", False)]
-    missing_clinicaltrials = [{"symbol": k} for k in sorted(genes) if not genes[k].get("_in_clinicaltrials", False)]
-    missing_string = [{"symbol": k} for k in sorted(genes) if not genes[k].get("_in_string", False)]
-
-    # All-N lists
-    all_five = sorted([
-        k for k, v in genes.items()
-        if v.get("_in_go") and v.get("_in_omim") and v.get("_in_hpo")
-        and v.get("_in_uniprot") and v.get("_in_facebase")
-    ])
-    all_seven = sorted([
-        k for k, v in genes.items()
-        if v.get("_in_go") and v.get("_in_omim") and v.get("_in_hpo")
-        and v.get("_in_uniprot") and v.get("_in_facebase")
-        and v.get("_in_clinvar") and v.get("_in_pubmed")
-    ])
-    all_ten = sorted([
-        k for k, v in genes.items()
-        if v.get("_in_go") and v.get("_in_omim") and v.get("_in_hpo")
-        and v.get("_in_uniprot") and v.get("_in_facebase")
-        and v.get("_in_clinvar") and v.get("_in_pubmed")
-        and v.get("_in_gnomad") and v.get("_in_nih_reporter")
-        and v.get("_in_gtex")
-    ])
-
-    # Research gaps
-    research_gaps = []
-    for k in sorted(genes):
-        v = genes[k]
-        if v.get("_in_omim") and not v.get("_in_facebase"):
+def _research_gap_entries(table: GeneTable):
+    """Research gaps: OMIM disease but no FaceBase data."""
+    for k, v, flags in zip(table.symbols, table.rows, table.flags):
+        if flags & MASK_OMIM and not flags & MASK_FACEBASE:
             entry = {"symbol": k}
             if "omim_syndromes" in v:
                 entry["syndromes"] = v["omim_syndromes"]
-            research_gaps.append(entry)
+            yield entry
+
+
+def iter_gap_report(unified: dict, table: GeneTable | None = None):
+    """Yield gap_report's (key, value) pairs in output order.
+
+    "summary" comes first as a dict, computed from a tally of the distinct
+    flag words. Every list section is yielded as a lazy iterator over the
+    table, so a writer can emit one section at a time without holding all
+    thirteen lists in memory.
+    """
+    if table is None:
+        table = build_table(unified)
+    symbols = table.symbols
+    flags = table.flags
+
+    missing_counts = [0] * len(SOURCES)
+    in_all_five = in_all_seven = in_all_ten = 0
+    for word, n in Counter(flags).items():
+        for i in range(len(SOURCES)):
+            if not word & (1 << i):
+                missing_counts[i] += n
+        if word & MASK_FIVE == MASK_FIVE:
+            in_all_five += n
+        if word & MASK_SEVEN == MASK_SEVEN:
+            in_all_seven += n
+        if word & MASK_TEN == MASK_TEN:
+            in_all_ten += n
+
+    summary = {
+        "total": len(unified),
+        "in_all_five": in_all_five,
+        "in_all_seven": in_all_seven,
+        "in_all_ten": in_all_ten,
+    }
+    for src, n in zip(SOURCES, missing_counts):
+        summary[f"missing_{src}_count"] = n
+
+    yield "summary", summary
+    yield "research_gaps", _research_gap_entries(table)
+    for i, src in enumerate(SOURCES):
+        yield f"missing_{src}", _missing_entries(symbols, flags, 1 << i)
+
 
+def write_gap_report(out, unified: dict, table: GeneTable | None = None) -> None:
+    """Write gap_report to the text stream out, one entry at a time.
+
+    The text is identical to json.dump(project_gap_report(...), out,
+    indent=2), but no section list is ever materialized.
+    """
+    out.write("{")
+    for n, (key, value) in enumerate(iter_gap_report(unified, table)):
+        out.write(f"{',' if n else ''}\n  {json.dumps(key)}: ")
+        if isinstance(value, dict):
+            out.write(json.dumps(value, indent=2).replace("\n", "\n  "))
+            continue
+        out.write("[")
+        j = -1
+        for j, entry in enumerate(value):
+            out.write(f"{',' if j else ''}\n    ")
+            out.write(json.dumps(entry, indent=2).replace("\n", "\n    "))
+        out.write("\n  ]" if j >= 0 else "]")
+    out.write("\n}")
+
+
+def project_gap_report(unified: dict, table: GeneTable | None = None) -> dict:
+    """Equivalent to: cue export ./model/ -e gap_report
+
+    Materializes iter_gap_report(); use write_gap_report() to stream it.
+    """
     return {
-        "summary": {
-            "total": len(genes),
-            "in_all_five": len(all_five),
-            "in_all_seven": len(all_seven),
-            "in_all_ten": len(all_ten),
-            "missing_go_count": len(missing_go),
-            "missing_omim_count": len(missing_omim),
-            "missing_hpo_count": len(missing_hpo),
-            "missing_uniprot_count": len(missing_uniprot),
-            "missing_facebase_count": len(missing_facebase),
-            "missing_clinvar_count": len(missing_clinvar),
-            "missing_pubmed_count": len(missing_pubmed),
-            "missing_gnomad_count": len(missing_gnomad),
-            "missing_nih_reporter_count": len(missing_nih_reporter),
-            "missing_gtex_count": len(missing_gtex),
-            "missing_clinicaltrials_count": len(missing_clinicaltrials),
-            "missing_string_count": len(missing_string),
-        },
-        "research_gaps": research_gaps,
-        "missing_go": missing_go,
-        "missing_omim": missing_omim,
-        "missing_hpo": missing_hpo,
-        "missing_uniprot": missing_uniprot,
-        "missing_facebase": missing_facebase,
-        "missing_clinvar": missing_clinvar,
-        "missing_pubmed": missing_pubmed,
-        "missing_gnomad": missing_gnomad,
-        "missing_nih_reporter": missing_nih_reporter,
-        "missing_gtex": missing_gtex,
-        "missing_clinicaltrials": missing_clinicaltrials,
-        "missing_string": missing_string,
+        key: value if isinstance(value, dict) else list(value)
+        for key, value in iter_gap_report(unified, table)
     }
 
 
-def project_funding_gaps(unified: dict) -> dict:
+# (gene field, output key) for optional fields copied into entries only
+# when present, in output key order.
+_FUNDING_OPTIONAL = (
+    ("omim_syndromes", "syndromes"),
+    ("pathogenic_count", "variant_count"),
+    ("pli_score", "pli_score"),
+    ("active_grant_count", "grant_count"),
+)
+_WEIGHTED_OPTIONAL = (
+    ("pubmed_total", "pub_count"),
+    ("pathogenic_count", "variant_count"),
+    ("pli_score", "pli_score"),
+    ("active_grant_count", "grant_count"),
+)
+
+
+def project_funding_gaps(unified: dict, table: GeneTable | None = None) -> dict:
     """Equivalent to: cue export ./model/ -e funding_gaps"""
     genes = unified
+    if table is None:
+        table = build_table(genes)
 
     genes_assessed = {}
-    for k in sorted(genes):
-        v = genes[k]
+    critical = []
+    for k, v in zip(table.symbols, table.rows):
         entry = {
             "symbol": k,
             "has_disease": v.get("_in_omim", False),
@@ -157,33 +199,25 @@ def project_funding_gaps(unified: dict) -> dict:
             "has_interactions": v.get("_in_string", False),
             "pub_count": v.get("pubmed_total", 0),
         }
-        if "omim_syndromes" in v:
-            entry["syndromes"] = v["omim_syndromes"]
-        if "pathogenic_count" in v:
-            entry["variant_count"] = v["pathogenic_count"]
-        if "pli_score" in v:
-            entry["pli_score"] = v["pli_score"]
-        if "active_grant_count" in v:
-            entry["grant_count"] = v["active_grant_count"]
+        entry.update({dst: v[src] for src, dst in _FUNDING_OPTIONAL if src in v})
         genes_assessed[k] = entry
 
-    critical = []
-    for k in sorted(genes):
-        v = genes[k]
-        if v.get("_in_omim") and not v.get("_in_facebase"):
-            entry = {"symbol": k}
-            if "omim_syndromes" in v:
-                entry["syndromes"] = v["omim_syndromes"]
-            entry["pub_count"] = v.get("pubmed_total", 0)
+        # Critical: OMIM disease but no FaceBase data. Reuses the values
+        # already pulled into entry; only phenotype_count is new.
+        if entry["has_disease"] and not entry["has_experiment"]:
+            crit = {"symbol": k}
+            if "syndromes" in entry:
+                crit["syndromes"] = entry["syndromes"]
+            crit["pub_count"] = entry["pub_count"]
             if "phenotypes" in v:
-                entry["phenotype_count"] = len(v["phenotypes"])
-            if "pathogenic_count" in v:
-                entry["variant_count"] = v["pathogenic_count"]
-            if "pli_score" in v:
-                entry["pli_score"] = v["pli_score"]
-            if "active_grant_count" in v:
-                entry["grant_count"] = v["active_grant_count"]
-            critical.append(entry)
+                crit["phenotype_count"] = len(v["phenotypes"])
+            if "variant_count" in entry:
+                crit["variant_count"] = entry["variant_count"]
+            if "pli_score" in entry:
+                crit["pli_score"] = entry["pli_score"]
+            if "grant_count" in entry:
+                crit["grant_count"] = entry["grant_count"]
+            critical.append(crit)
 
     return {
         "genes_assessed": genes_assessed,
@@ -195,38 +229,15 @@ def project_funding_gaps(unified: dict) -> dict:
     }
 
 
-def project_weighted_gaps(unified: dict) -> dict:
+def project_weighted_gaps(unified: dict, table: GeneTable | None = None) -> dict:
     """Equivalent to: cue export ./model/ -e weighted_gaps"""
-    result = {}
-    for k in sorted(unified):
-        v = unified[k]
-
-        # Syndrome burden
-        syn_count = len(v["omim_syndromes"]) if "omim_syndromes" in v else 0
-        syndrome_score = syn_count * 5
-
-        # Phenotype richness
-        pheno_count = len(v["phenotypes"]) if "phenotypes" in v else 0
-        pheno_score = 3 if (v.get("_in_hpo") and pheno_count > 10) else 0
+    if table is None:
+        table = build_table(unified)
 
-        # FaceBase gap
-        facebase_gap = 0 if v.get("_in_facebase") else 10
-
-        # Constraint
-        pli = v.get("pli_score", 0.0) if "pli_score" in v else 0.0
-        constraint_score = 3 if pli > 0.9 else 0
-
-        # Understudied
-        pub_total = v.get("pubmed_total", -1) if "pubmed_total" in v else -1
-        if pub_total >= 0 and pub_total < 10:
-            pub_score = 1
-        elif pub_total < 0:
-            pub_score = 1
-        else:
-            pub_score = 0
-
-        priority_score = syndrome_score + pheno_score + facebase_gap + constraint_score + pub_score
+    scores = priority_scores(table)
 
+    result = {}
+    for k, v, priority_score in zip(table.symbols, table.rows, scores):
         entry = {
             "symbol": k,
             "priority_score": priority_score,
@@ -235,92 +246,64 @@ def project_weighted_gaps(unified: dict) -> dict:
         }
         if "omim_syndromes" in v:
             entry["syndrome_count"] = len(v["omim_syndromes"])
-        if "pubmed_total" in v:
-            entry["pub_count"] = v["pubmed_total"]
-        if "pathogenic_count" in v:
-            entry["variant_count"] = v["pathogenic_count"]
-        if "pli_score" in v:
-            entry["pli_score"] = v["pli_score"]
-        if "active_grant_count" in v:
-            entry["grant_count"] = v["active_grant_count"]
+        entry.update({dst: v[src] for src, dst in _WEIGHTED_OPTIONAL if src in v})
 
         result[k] = entry
 
     return result
 
 
-def project_anomalies(unified: dict) -> dict:
-    """Equivalent to: cue export ./model/ -e anomalies"""
-    genes = unified
+# Constant part of each anomaly rule's entries, in output key order after
+# "symbol".
+_OMIM_NO_CLINVAR = {
+    "anomaly_type": "omim_no_clinvar",
+    "description": "Has OMIM disease association but 0 ClinVar pathogenic variants",
+    "severity": "warning",
+}
+_HIGH_PLI_NO_TRIALS = {
+    "anomaly_type": "high_pli_no_trials",
+    "description": "Highly constrained (pLI > 0.9) but no active clinical trials",
+    "severity": "info",
+}
+_HIGH_PUBS_NO_FACEBASE = {
+    "anomaly_type": "high_pubs_no_facebase",
+    "description": "Over 500 publications but no FaceBase experimental data",
+    "severity": "warning",
+}
+_CLINVAR_NO_HPO = {
+    "anomaly_type": "clinvar_no_hpo",
+    "description": "Over 10 pathogenic variants but no HPO phenotypes listed",
+    "severity": "error",
+}
 
-    # Build anomaly input intermediates (mirrors _anomaly_input in CUE)
-    omim_no_clinvar = []
-    high_pli_no_trials = []
-    high_pubs_no_facebase = []
-    clinvar_no_hpo = []
-
-    for k in sorted(genes):
-        v = genes[k]
-
-        has_omim = v.get("_in_omim", False)
-        has_facebase = v.get("_in_facebase", False)
-        has_hpo = v.get("_in_hpo", False)
-
-        syn_count = len(v["omim_syndromes"]) if "omim_syndromes" in v else 0
-        pathogenic = v.get("pathogenic_count", 0) if "pathogenic_count" in v else 0
-        pli = v.get("pli_score", 0.0) if "pli_score" in v else 0.0
-        trial_count = v.get("active_trial_count", 0) if "active_trial_count" in v else 0
-        pub_total = v.get("pubmed_total", 0) if "pubmed_total" in v else 0
-        pheno_count = len(v["phenotypes"]) if "phenotypes" in v else 0
-        has_pli = "pli_score" in v
-
-        # Rule 1: OMIM disease but 0 ClinVar pathogenic variants
-        if has_omim and syn_count > 0 and pathogenic == 0:
-            entry = {
-                "symbol": k,
-                "anomaly_type": "omim_no_clinvar",
-                "description": "Has OMIM disease association but 0 ClinVar pathogenic variants",
-                "severity": "warning",
-            }
-            if "omim_syndromes" in v:
-                entry["syndromes"] = v["omim_syndromes"]
-            omim_no_clinvar.append(entry)
-
-        # Rule 2: High pLI but no clinical trials
-        if has_pli and pli > 0.9 and trial_count == 0:
-            entry = {
-                "symbol": k,
-                "anomaly_type": "high_pli_no_trials",
-                "description": "Highly constrained (pLI > 0.9) but no active clinical trials",
-                "severity": "info",
-            }
-            if "pli_score" in v:
-                entry["pli_score"] = v["pli_score"]
-            high_pli_no_trials.append(entry)
-
-        # Rule 3: High publication count but no FaceBase
-        if pub_total > 500 and not has_facebase:
-            entry = {
-                "symbol": k,
-                "anomaly_type": "high_pubs_no_facebase",
-                "description": "Over 500 publications but no FaceBase experimental data",
-                "severity": "warning",
-            }
-            if "pubmed_total" in v:
-                entry["pub_count"] = v["pubmed_total"]
-            high_pubs_no_facebase.append(entry)
-
-        # Rule 4: ClinVar pathogenic variants but no HPO phenotypes
-        if pathogenic > 10 and pheno_count == 0:
-            entry = {
-                "symbol": k,
-                "anomaly_type": "clinvar_no_hpo",
-                "description": "Over 10 pathogenic variants but no HPO phenotypes listed",
-                "severity": "error",
-            }
-            if "pathogenic_count" in v:
-                entry["pathogenic_count"] = v["pathogenic_count"]
-            clinvar_no_hpo.append(entry)
+
+def project_anomalies(unified: dict, table: GeneTable | None = None) -> dict:
+    """Equivalent to: cue export ./model/ -e anomalies"""
+    if table is None:
+        table = build_table(unified)
+    symbols = table.symbols
+    rule1, rule2, rule3, rule4 = anomaly_rows(table)
+
+    omim_no_clinvar = [{
+        "symbol": symbols[i],
+        **_OMIM_NO_CLINVAR,
+        "syndromes": table.rows[i]["omim_syndromes"],
+    } for i in rule1]
+    high_pli_no_trials = [{
+        "symbol": symbols[i],
+        **_HIGH_PLI_NO_TRIALS,
+        "pli_score": table.pli_score[i],
+    } for i in rule2]
+    high_pubs_no_facebase = [{
+        "symbol": symbols[i],
+        **_HIGH_PUBS_NO_FACEBASE,
+        "pub_count": table.pubmed_total[i],
+    } for i in rule3]
+    clinvar_no_hpo = [{
+        "symbol": symbols[i],
+        **_CLINVAR_NO_HPO,
+        "pathogenic_count": table.pathogenic_count[i],
+    } for i in rule4]
 
     all_anomalies = omim_no_clinvar + high_pli_no_trials + high_pubs_no_facebase + clinvar_no_hpo
 
@@ -350,6 +333,19 @@ ALL_PROJECTIONS = {
 }
 
 
-def compute_all(unified: dict) -> dict:
-    """Run every projection and return {name: result}."""
-    return {name: fn(unified) for name, fn in ALL_PROJECTIONS.items()}
+def compute_all(
+    unified: dict, table: GeneTable | None = None, exclude=(),
+) -> dict:
+    """Run every projection not in exclude and return {name: result}.
+
+    The gene table (sorted symbols, gene rows, packed flags and the
+    numeric columns) is built once, unless passed in, and shared by all
+    projections.
+    """
+    if table is None:
+        table = build_table(unified)
+    return {
+        name: fn(unified, table=table)
+        for name, fn in ALL_PROJECTIONS.items()
+        if name not in exclude
+    }
@@ -10,9 +10,13 @@ Four proofs:
 Run: python3 unifier/prove.py
 """
 
+import hashlib
 import json
+import os
 import random
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 # Add repo root to path so imports work when run as script
@@ -20,11 +24,13 @@ repo_root = str(Path(__file__).resolve().parent.parent)
 sys.path.insert(0, repo_root)
 
 from unifier.merge import merge_all_sources
+from unifier.schema import GENE_DEFAULTS, OPTIONAL_FIELDS, SOURCE_FLAGS
 from unifier.source_reader import (
     SOURCE_FILES,
     SOURCE_NAMES,
+    orjson,
     read_all_sources,
-    read_cue_projection,
+    read_cue_projections,
     read_cue_unified,
 )
 from unifier.projections import (
@@ -39,41 +45,100 @@ from unifier.projections import (
 PASS = "PASS"
 FAIL = "FAIL"
 
+_PRIMITIVES = (str, bool, int)
+_MISSING = object()
+
 
 def deep_compare(a, b, path=""):
-    """Recursively compare two values, returning list of (path, a_val, b_val) diffs."""
+    """Compare two values, returning list of (path, a_val, b_val) diffs.
+
+    Walks the structures with an explicit stack rather than recursion.
+    Children are pushed in reverse so diffs come out in the same
+    depth-first, sorted-key order a recursive walk would produce.
+    """
     diffs = []
-    if isinstance(a, dict) and isinstance(b, dict):
-        all_keys = set(a.keys()) | set(b.keys())
-        for key in sorted(all_keys):
-            child_path = f"{path}.{key}" if path else key
-            if key not in a:
-                diffs.append((child_path, "<missing>", b[key]))
-            elif key not in b:
-                diffs.append((child_path, a[key], "<missing>"))
-            else:
-                diffs.extend(deep_compare(a[key], b[key], child_path))
-    elif isinstance(a, list) and isinstance(b, list):
-        if len(a) != len(b):
-            diffs.append((f"{path}[len]", len(a), len(b)))
-        for i in range(min(len(a), len(b))):
-            diffs.extend(deep_compare(a[i], b[i], f"{path}[{i}]"))
-    elif isinstance(a, (int, float)) and isinstance(b, (int, float)):
-        # Numeric comparison: CUE may export 1 vs 1.0
-        if abs(float(a) - float(b)) > 1e-10:
+    stack = [(a, b, path)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        a, b, path = pop()
+        if a is b:
+            continue
+        # Fast path: most leaves are same-typed strings, bools and ints
+        ta = type(a)
+        if ta is type(b) and ta in _PRIMITIVES:
+            if a != b:
+                diffs.append((path, a, b))
+        elif a is _MISSING:
+            diffs.append((path, "<missing>", b))
+        elif b is _MISSING:
+            diffs.append((path, a, "<missing>"))
+        elif isinstance(a, dict) and isinstance(b, dict):
+            all_keys = set(a.keys()) | set(b.keys())
+            for key in sorted(all_keys, reverse=True):
+                child_path = f"{path}.{key}" if path else key
+                push((a.get(key, _MISSING), b.get(key, _MISSING), child_path))
+        elif isinstance(a, list) and isinstance(b, list):
+            if len(a) != len(b):
+                diffs.append((f"{path}[len]", len(a), len(b)))
+            for i in range(min(len(a), len(b)) - 1, -1, -1):
+                push((a[i], b[i], f"{path}[{i}]"))
+        elif isinstance(a, (int, float)) and isinstance(b, (int, float)):
+            # Numeric comparison: CUE may export 1 vs 1.0
+            if abs(float(a) - float(b)) > 1e-10:
+                diffs.append((path, a, b))
+        elif a != b:
             diffs.append((path, a, b))
-    elif a != b:
-        diffs.append((path, a, b))
     return diffs
 
 
+def _fingerprint(obj) -> bytes:
+    """Digest of a canonical JSON encoding, for cheap whole-result equality.
+
+    Uses orjson when it is installed; either encoder is deterministic for
+    a given input, which is all the digest comparison needs.
+
+    Equal digests mean the results are identical. Different digests do not
+    prove a mismatch (deep_compare treats 1 and 1.0 as equal, JSON does
+    not), so callers fall back to deep_compare for the verdict.
+    """
+    if orjson is not None:
+        data = orjson.dumps(
+            obj,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+    else:
+        data = json.dumps(obj, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
 def strip_hidden(gene_dict: dict) -> dict:
     """Remove _in_* fields from a gene dict for comparison with CUE export.
 
     CUE doesn't export hidden fields in the genes expression --
     we compare those separately via gene_sources.
+
+    Returns gene_dict itself when it has no hidden fields (e.g. genes read
+    back from a CUE export); callers must not mutate the result.
+    """
+    if not any(k[:1] == "_" for k in gene_dict):
+        return gene_dict
+    return {k: v for k, v in gene_dict.items() if k[:1] != "_"}
+
+
+# Every field a merge of the SOURCE_FILES can set
+OWNED_FIELDS = frozenset({"symbol", *GENE_DEFAULTS, *OPTIONAL_FIELDS})
+
+
+def owned_fields(gene_dict: dict) -> dict:
+    """Keep only the fields the 12 SOURCE_FILES own.
+
+    The model also unifies sources that source_reader doesn't read
+    (Orphanet, Open Targets, models, structures). Their fields are in
+    CUE's unified genes but never in the Python merge.
     """
-    return {k: v for k, v in gene_dict.items() if not k.startswith("_")}
+    return {k: v for k, v in gene_dict.items() if k in OWNED_FIELDS}
 
 
 def prove_merge_equivalence(cue_unified, python_unified, gene_list):
@@ -89,8 +154,8 @@ def prove_merge_equivalence(cue_unified, python_unified, gene_list):
         py_gene = python_unified.get(symbol, {})
 
         # Compare visible fields (CUE genes export omits _in_* hidden fields)
-        cue_visible = strip_hidden(cue_gene)
-        py_visible = strip_hidden(py_gene)
+        cue_visible = strip_hidden(owned_fields(cue_gene))
+        py_visible = strip_hidden(owned_fields(py_gene))
 
         diffs = deep_compare(cue_visible, py_visible, path=symbol)
         field_count = len(cue_visible)
@@ -101,10 +166,7 @@ def prove_merge_equivalence(cue_unified, python_unified, gene_list):
             mismatches.append((path, cue_val, py_val))
 
         # Also compare _in_* flags
-        for flag in ["_in_go", "_in_omim", "_in_hpo", "_in_uniprot",
-                      "_in_facebase", "_in_clinvar", "_in_pubmed",
-                      "_in_gnomad", "_in_nih_reporter", "_in_gtex",
-                      "_in_clinicaltrials", "_in_string"]:
+        for flag in SOURCE_FLAGS:
             total_fields += 1
             cue_val = cue_gene.get(flag, False)
             py_val = py_gene.get(flag, False)
@@ -127,27 +189,46 @@ def prove_merge_equivalence(cue_unified, python_unified, gene_list):
     return PASS
 
 
+def _run_shuffle(gene_list, all_contributions, canonical, canon_hash, seed):
+    """Merge the sources in a seeded random order and diff against canonical."""
+    shuffled = list(all_contributions)
+    random.Random(seed).shuffle(shuffled)
+    result = merge_all_sources(gene_list, shuffled)
+    if _fingerprint(result) == canon_hash:
+        return []
+    return deep_compare(canonical, result)
+
+
 def prove_commutativity(gene_list, all_contributions, shuffles=5):
-    """Proof 2: Merge in any order produces the same result."""
+    """Proof 2: Merge in any order produces the same result.
+
+    Shuffles are independent, so they run in parallel worker processes.
+    """
     print(f"\n=== COMMUTATIVITY PROOF ({shuffles} shuffles) ===")
 
     # Canonical merge (original order)
     canonical = merge_all_sources(gene_list, all_contributions)
 
-    all_pass = True
-    for i in range(shuffles):
-        shuffled = list(all_contributions)
-        random.shuffle(shuffled)
-        result = merge_all_sources(gene_list, shuffled)
-
-        diffs = deep_compare(canonical, result)
-        if diffs:
-            print(f"  Shuffle {i+1}: FAIL ({len(diffs)} diffs)")
-            for path, a, b in diffs[:5]:
-                print(f"    {path}: canonical={a!r}  shuffled={b!r}")
-            all_pass = False
-        else:
-            print(f"  Shuffle {i+1}: MATCH (all fields identical)")
+    workers = min(shuffles, os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        results = ex.map(
+            _run_shuffle,
+            repeat(gene_list, shuffles),
+            repeat(all_contributions, shuffles),
+            repeat(canonical, shuffles),
+            repeat(_fingerprint(canonical), shuffles),
+            range(shuffles),
+        )
+
+        all_pass = True
+        for i, diffs in enumerate(results):
+            if diffs:
+                print(f"  Shuffle {i+1}: FAIL ({len(diffs)} diffs)")
+                for path, a, b in diffs[:5]:
+                    print(f"    {path}: canonical={a!r}  shuffled={b!r}")
+                all_pass = False
+            else:
+                print(f"  Shuffle {i+1}: MATCH (all fields identical)")
 
     return PASS if all_pass else FAIL
 
@@ -158,15 +239,20 @@ def prove_idempotency(gene_list, all_contributions):
 
     # Canonical merge
     canonical = merge_all_sources(gene_list, all_contributions)
+    canon_hash = _fingerprint(canonical)
 
+    source_names = tuple(SOURCE_NAMES.values())
     all_pass = True
     for idx, source_data in enumerate(all_contributions):
-        source_name = list(SOURCE_NAMES.values())[idx]
+        source_name = source_names[idx]
         # Double the source: merge it once more
         doubled = list(all_contributions) + [source_data]
         result = merge_all_sources(gene_list, doubled)
 
-        diffs = deep_compare(canonical, result)
+        if _fingerprint(result) == canon_hash:
+            diffs = []
+        else:
+            diffs = deep_compare(canonical, result)
         if diffs:
             print(f"  Double-merge {source_name}: FAIL ({len(diffs)} diffs)")
             for path, a, b in diffs[:3]:
@@ -191,10 +277,14 @@ def prove_projection_equivalence(python_unified):
         "anomalies": (project_anomalies, "anomalies"),
     }
 
+    # Export every CUE projection up front; the cue runs overlap
+    cue_results = read_cue_projections(
+        [cue_expr for _, cue_expr in projections.values()], repo_root=repo_root,
+    )
+
     all_pass = True
-    for name, (func, cue_expr) in projections.items():
+    for (name, (func, _)), cue_data in zip(projections.items(), cue_results):
         print(f"  {name}: ", end="", flush=True)
-        cue_data = read_cue_projection(cue_expr, repo_root=repo_root)
         py_data = func(python_unified)
 
         diffs = deep_compare(cue_data, py_data)
@@ -45,7 +45,7 @@ OPTIONAL_FIELDS = {
     "clinicaltrials_studies", "string_interaction_count", "string_partners",
 }
 
-SOURCE_FLAGS = [k for k in GENE_DEFAULTS if k.startswith("_in_")]
+SOURCE_FLAGS = tuple(k for k in GENE_DEFAULTS if k.startswith("_in_"))
 
 # Expected types for optional fields (for validation)
 OPTIONAL_FIELD_TYPES = {
@@ -78,11 +78,33 @@ OPTIONAL_FIELD_TYPES = {
     "string_partners": list,
 }
 
+_ABSENT = object()
+
+# (field, expected type, type name used in errors), flattened once:
+# _in_* flags must be bool, *_id fields must be str, and optional fields,
+# if present, must have the type in OPTIONAL_FIELD_TYPES.
+_VALIDATION_RULES = (
+    tuple((f, bool, "bool") for f in SOURCE_FLAGS)
+    + tuple((f, str, "str") for f in GENE_DEFAULTS if f.endswith("_id"))
+    + tuple(
+        (f, expected, str(expected))
+        for f, expected in OPTIONAL_FIELD_TYPES.items()
+        if f in OPTIONAL_FIELDS
+    )
+)
+
+# new_gene() copies this; "symbol" comes first to keep the field order
+_DEFAULTS_TEMPLATE = {"symbol": "", **GENE_DEFAULTS}
+
 
 def new_gene(symbol: str) -> dict:
-    """Return a gene dict with all defaults + symbol set."""
-    gene = {"symbol": symbol}
-    gene.update(GENE_DEFAULTS)
+    """Return a gene dict with all defaults + symbol set.
+
+    Default values are shared with GENE_DEFAULTS, not copied, so they must
+    be treated as immutable: replace a field's value, never mutate it.
+    """
+    gene = _DEFAULTS_TEMPLATE.copy()
+    gene["symbol"] = symbol
     return gene
 
 
@@ -98,27 +120,12 @@ def validate_gene(gene_dict: dict) -> list[str]:
     if not isinstance(symbol, str) or not symbol:
         errors.append("symbol must be a non-empty string")
 
-    # All _in_* flags must be bool
-    for flag in SOURCE_FLAGS:
-        if flag in gene_dict and not isinstance(gene_dict[flag], bool):
-            errors.append(f"{flag} must be bool, got {type(gene_dict[flag]).__name__}")
-
-    # All *_id fields must be str
-    for field in GENE_DEFAULTS:
-        if field.endswith("_id") and field in gene_dict:
-            if not isinstance(gene_dict[field], str):
-                errors.append(
-                    f"{field} must be str, got {type(gene_dict[field]).__name__}"
-                )
-
-    # Optional fields, if present, must have correct types
-    for field in OPTIONAL_FIELDS:
-        if field in gene_dict:
-            expected = OPTIONAL_FIELD_TYPES.get(field)
-            if expected and not isinstance(gene_dict[field], expected):
-                errors.append(
-                    f"{field} must be {expected}, "
-                    f"got {type(gene_dict[field]).__name__}"
-                )
+    # Typed fields, if present, must have the expected type
+    for field, expected, expected_name in _VALIDATION_RULES:
+        val = gene_dict.get(field, _ABSENT)
+        if val is not _ABSENT and not isinstance(val, expected):
+            errors.append(
+                f"{field} must be {expected_name}, got {type(val).__name__}"
+            )
 
     return errors
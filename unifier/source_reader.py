@@ -5,11 +5,26 @@ that the source actually contributes. This isolates each source's
 contribution so Python can re-merge them identically to CUE.
 """
 
+import hashlib
 import json
+import os
+import selectors
+import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# Optional orjson, shared by the other unifier modules: orjson is None
+# when it is not installed, and _loads parses JSON with whichever is there.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+_loads = json.loads if orjson is None else orjson.loads
+
 from .schema import GENE_DEFAULTS, OPTIONAL_FIELDS, SOURCE_FLAGS
 
 # All 12 source CUE files
@@ -45,56 +60,322 @@ SOURCE_NAMES = {
 }
 
 
+# On-disk cache of cue export output, keyed by the cue binary, the
+# expression and the input file contents. Off unless CUE_CACHE=1; only the
+# CUE_CACHE_MAX_ENTRIES most recently written entries are kept. None means
+# ~/.cache/froq, resolved on first use.
+CUE_CACHE_DIR: Path | None = None
+CUE_CACHE_MAX_ENTRIES = 32
+
+# The cue binary, resolved against PATH once at import rather than on
+# every launch; falls back to the bare name if it is not on PATH yet.
+_CUE = shutil.which("cue") or "cue"
+
+
+def _cue_cache_dir() -> Path | None:
+    """Directory of the disk cache, or None if there is no home to put it in."""
+    if CUE_CACHE_DIR is not None:
+        return CUE_CACHE_DIR
+    try:
+        return Path.home() / ".cache" / "froq"
+    except RuntimeError:
+        return None
+
+
+def _cue_cache_key(expression: str, files, cwd: str | None) -> str | None:
+    """Hash the cue binary, the expression and every input .cue file.
+
+    The binary is identified by its path, mtime and size, so upgrading cue
+    invalidates the cache. Directory arguments (e.g. ./model/) hash each
+    *.cue file directly in them, the same files cue loads for the package.
+
+    Returns None if the binary or an input file can't be read.
+    """
+    try:
+        st = os.stat(_CUE)
+    except OSError:
+        return None
+    base = Path(cwd) if cwd else Path.cwd()
+    h = hashlib.blake2b(
+        f"{_CUE}\0{st.st_mtime_ns}\0{st.st_size}\0".encode(), digest_size=20,
+    )
+    h.update(expression.encode())
+    for f in files:
+        path = base / f
+        paths = sorted(path.glob("*.cue")) if path.is_dir() else [path]
+        for p in paths:
+            try:
+                data = p.read_bytes()
+            except OSError:
+                return None
+            h.update(b"\0" + os.fsencode(p.name) + b"\0" + data)
+    return h.hexdigest()
+
+
+def _write_cache(path: Path, data: bytes) -> None:
+    """Write data to path atomically (temp file + os.replace).
+
+    Then evicts the oldest entries beyond CUE_CACHE_MAX_ENTRIES.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+    entries = []
+    for entry in path.parent.glob("cue-*.json"):
+        try:
+            entries.append((entry.stat().st_mtime_ns, entry))
+        except OSError:
+            pass
+    entries.sort(reverse=True)
+    for _, entry in entries[CUE_CACHE_MAX_ENTRIES:]:
+        entry.unlink(missing_ok=True)
+
+
+def _read_cache(path: Path) -> bytes | None:
+    """A cached export's bytes, or None on a miss.
+
+    An entry that can't be read or doesn't parse as JSON counts as a miss
+    and is removed, so the export falls back to running cue.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        _loads(data)
+    except ValueError:
+        path.unlink(missing_ok=True)
+        return None
+    return data
+
+
 def cue_export(expression: str, files: list[str], cwd: str | None = None) -> dict:
     """Run cue export and return parsed JSON.
 
+    With CUE_CACHE=1, output is cached on disk (CUE_CACHE_DIR,
+    ~/.cache/froq by default) by a hash of the cue binary, the expression
+    and the input files' contents, so upgrading cue or editing any .cue
+    file invalidates it.
+    Within a process, the raw output is also memoized on that same hash,
+    so edits are seen there too; each call still parses a fresh object,
+    so callers may mutate the result.
+
     Args:
         expression: CUE expression to export (e.g. 'genes')
         files: list of CUE files to load
         cwd: working directory for subprocess
     """
-    cmd = ["cue", "export"] + files + ["-e", expression]
+    return _loads(_cue_output(expression, tuple(files), cwd))
+
+
+def _cue_cache_path(key: str | None) -> Path | None:
+    """Disk cache location for a _cue_cache_key, or None if caching is off."""
+    if key is None or os.environ.get("CUE_CACHE") != "1":
+        return None
+    cache_dir = _cue_cache_dir()
+    return None if cache_dir is None else cache_dir / f"cue-{key}.json"
+
+
+def _cue_cmd(expression: str, files, cwd: str | None) -> list[str]:
+    # Resolve the inputs against cwd instead of passing cwd= (and keep
+    # close_fds off; our fds are non-inheritable anyway) so subprocess can
+    # launch cue with posix_spawn rather than fork + exec.
+    if cwd is not None:
+        files = [os.path.join(cwd, f) for f in files]
+    return [_CUE, "export", *files, "-e", expression]
+
+
+def _cue_result(
+    cmd: list[str], returncode: int, stdout: bytes, stderr: bytes,
+    cache_path: Path | None,
+) -> bytes:
+    """Check a finished cue run and store its output in the disk cache."""
+    if returncode != 0:
+        stderr = stderr.decode("utf-8", "replace")
+        raise RuntimeError(
+            f"cue export failed: {stderr}\nCommand: {' '.join(cmd)}"
+        )
+    if cache_path is not None:
+        try:
+            _write_cache(cache_path, stdout)
+        except OSError:
+            pass  # the cache is best-effort
+    return stdout
+
+
+def _cue_output(expression: str, files: tuple[str, ...], cwd: str | None) -> bytes:
+    """Raw JSON output of cue export, from the memo, the disk cache or a cue run."""
+    key = _cue_cache_key(expression, files, cwd)
+    if key is None:
+        return _run_cue(expression, files, cwd, None)
+    return _cue_output_for_key(key, expression, files, cwd)
+
+
+@lru_cache(maxsize=64)
+def _cue_output_for_key(
+    key: str, expression: str, files: tuple[str, ...], cwd: str | None,
+) -> bytes:
+    # Memoized on key, the content hash, so an edited .cue file or a new
+    # cue binary misses the memo just as it misses the disk cache.
+    cache_path = _cue_cache_path(key)
+    if cache_path is not None:
+        data = _read_cache(cache_path)
+        if data is not None:
+            return data
+    return _run_cue(expression, files, cwd, cache_path)
+
+
+def _run_cue(
+    expression: str, files, cwd: str | None, cache_path: Path | None,
+) -> bytes:
+    """Run cue export and return its raw output."""
+    cmd = _cue_cmd(expression, files, cwd)
+    # Keep stdout as bytes: orjson parses bytes directly, and the disk
+    # cache stores them as-is. stderr is only decoded for the error.
     result = subprocess.run(
         cmd,
         capture_output=True,
-        text=True,
-        cwd=cwd,
+        close_fds=False,
+    )
+    return _cue_result(
+        cmd, result.returncode, result.stdout, result.stderr, cache_path,
     )
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"cue export failed: {result.stderr}\nCommand: {' '.join(cmd)}"
-        )
-    return json.loads(result.stdout)
 
 
-def read_source(source_file: str, repo_root: str | None = None) -> dict:
-    """Export a single source's full gene struct via CUE.
+def _parse_finished(
+    cmd: list[str], proc: subprocess.Popen, out: list[bytes], err: list[bytes],
+    cache_path: Path | None,
+):
+    """Reap a cue run whose pipes are drained and parse its output."""
+    return _loads(
+        _cue_result(cmd, proc.wait(), b"".join(out), b"".join(err), cache_path)
+    )
 
-    Runs: cue export model/schema.cue model/gene_list.cue model/<source>.cue -e genes
-    plus the proj_sources.cue for hidden _in_* flags.
 
-    Returns the full genes dict (all genes, all fields including defaults).
+def cue_export_parallel(
+    jobs: list[tuple[str, list[str]]], cwd: str | None = None,
+    max_procs: int | None = None,
+) -> list:
+    """Run several cue exports concurrently; return parsed results in order.
+
+    jobs is a list of (expression, files). Exports not served by the disk
+    cache are launched as cue processes, at most max_procs (default: the
+    CPU count) at a time, and one selector drains all of their
+    stdout/stderr pipes as data arrives, so the cue processes run side by
+    side without a thread per process. As soon as one export's pipes hit
+    EOF its output is handed to a worker thread for parsing, which
+    overlaps with the exports still running, and the next export starts.
     """
-    files = [
+    if max_procs is None:
+        max_procs = os.cpu_count() or 1
+    futures = [None] * len(jobs)
+    pending = iter(enumerate(jobs))
+    running = []
+    sel = selectors.DefaultSelector()
+
+    def launch():
+        # Start exports until max_procs are running or none are left;
+        # cache hits go straight to the parser and don't count.
+        for i, (expression, files) in pending:
+            cache_path = _cue_cache_path(
+                _cue_cache_key(expression, files, cwd)
+            )
+            data = None if cache_path is None else _read_cache(cache_path)
+            if data is not None:
+                futures[i] = pool.submit(_loads, data)
+                continue
+            cmd = _cue_cmd(expression, files, cwd)
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                close_fds=False,
+            )
+            out, err = [], []
+            job = (i, cmd, proc, out, err, cache_path)
+            sel.register(proc.stdout, selectors.EVENT_READ, (job, out))
+            sel.register(proc.stderr, selectors.EVENT_READ, (job, err))
+            running.append(proc)
+            if len(running) >= max_procs:
+                return
+
+    # Parsing holds the GIL, so a single worker is all that helps
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        try:
+            launch()
+            while sel.get_map():
+                for key, _ in sel.select():
+                    job, chunks = key.data
+                    data = os.read(key.fd, 1 << 16)
+                    if data:
+                        chunks.append(data)
+                        continue
+                    sel.unregister(key.fileobj)
+                    key.fileobj.close()
+                    i, cmd, proc, out, err, cache_path = job
+                    if proc.stdout.closed and proc.stderr.closed:
+                        running.remove(proc)
+                        futures[i] = pool.submit(
+                            _parse_finished, cmd, proc, out, err, cache_path,
+                        )
+                        launch()
+        except BaseException:
+            for proc in running:
+                proc.kill()
+                proc.wait()
+            raise
+        finally:
+            sel.close()
+
+        return [future.result() for future in futures]
+
+
+def _merge_source_flags(genes_data: dict, source_flags: dict) -> dict:
+    """Merge the gene_sources in_* flags back into genes as _in_* fields."""
+    for symbol, flags in source_flags.items():
+        if symbol in genes_data:
+            # proj_sources uses "in_go" etc. -- we need "_in_go"
+            genes_data[symbol].update(("_" + k, v) for k, v in flags.items())
+    return genes_data
+
+
+def _source_files(source_file: str) -> list[str]:
+    """The CUE files that evaluate one source on its own."""
+    return [
         "model/schema.cue",
         "model/gene_list.cue",
         source_file,
         "model/proj_sources.cue",
     ]
+
+
+def read_source(source_file: str, repo_root: str | None = None) -> dict:
+    """Export a single source's full gene struct via CUE.
+
+    Runs: cue export model/schema.cue model/gene_list.cue model/<source>.cue -e genes
+    plus the proj_sources.cue for hidden _in_* flags.
+
+    Returns the full genes dict (all genes, all fields including defaults).
+    """
+    files = _source_files(source_file)
     # Get the visible fields (genes export doesn't include _in_* hidden fields)
     genes_data = cue_export("genes", files[:3], cwd=repo_root)
     # Get the source flags via the projection
     source_flags = cue_export("gene_sources", files, cwd=repo_root)
+    return _merge_source_flags(genes_data, source_flags)
 
-    # Merge the _in_* flags back into the gene dicts (with underscore prefix)
-    for symbol, flags in source_flags.items():
-        if symbol in genes_data:
-            for flag_name, flag_value in flags.items():
-                # proj_sources uses "in_go" etc. -- we need "_in_go"
-                hidden_name = f"_{flag_name}"
-                genes_data[symbol][hidden_name] = flag_value
 
-    return genes_data
+# (field, default) pairs, scanned in order for every gene, and the fields
+# that are not optional: a gene field outside this set is always kept.
+_DEFAULTS_LIST = tuple(GENE_DEFAULTS.items())
+_DEFAULTED_FIELDS = frozenset(GENE_DEFAULTS) | {"symbol"}
 
 
 def extract_contributions(full_genes: dict) -> dict:
@@ -106,22 +387,26 @@ def extract_contributions(full_genes: dict) -> dict:
 
     Returns: {symbol: {field: value, ...}} only for genes with contributions.
     """
+    # Walk the small defaults table once per gene, keeping fields that are
+    # off their default; the defaults are all "" or False, which the JSON
+    # decoder returns as the same singleton objects, so the identity test
+    # settles most fields before == is reached. Optional or unknown fields
+    # have no default and are always kept, in the gene's own field order.
+    defaults_list = _DEFAULTS_LIST
+    defaulted = _DEFAULTED_FIELDS
     contributions = {}
     for symbol, gene in full_genes.items():
-        non_default = {}
-        for field, value in gene.items():
-            if field == "symbol":
-                continue
-
-            if field in GENE_DEFAULTS:
-                # Defaulted field -- skip if at default
-                if value == GENE_DEFAULTS[field]:
-                    continue
-                non_default[field] = value
-            else:
-                # Optional or unknown field -- always a contribution
-                non_default[field] = value
-
+        g_get = gene.get
+        non_default = {
+            field: value
+            for field, default in defaults_list
+            if (value := g_get(field, default)) is not default
+            and value != default
+        }
+        non_default.update(
+            (field, value) for field, value in gene.items()
+            if field not in defaulted
+        )
         if non_default:
             contributions[symbol] = non_default
 
@@ -131,15 +416,26 @@ def extract_contributions(full_genes: dict) -> dict:
 def read_all_sources(repo_root: str | None = None) -> list[dict]:
     """Read all 12 source files and extract their contributions.
 
+    Each source is exported on its own, exactly as read_source does, but
+    the exports run concurrently (see cue_export_parallel).
+
     Returns: list of 12 dicts, each is {symbol: {field: value}} for
              genes where that source contributes non-default data.
     """
-    all_contributions = []
+    jobs = []
     for source_file in SOURCE_FILES:
-        name = SOURCE_NAMES[source_file]
-        full_genes = read_source(source_file, repo_root=repo_root)
+        files = _source_files(source_file)
+        jobs += [("genes", files[:3]), ("gene_sources", files)]
+    exported = cue_export_parallel(jobs, cwd=repo_root)
+
+    all_contributions = []
+    for source_file, genes_data, source_flags in zip(
+        SOURCE_FILES, exported[0::2], exported[1::2],
+    ):
+        full_genes = _merge_source_flags(genes_data, source_flags)
         contributions = extract_contributions(full_genes)
         all_contributions.append(contributions)
+        name = SOURCE_NAMES[source_file]
         print(f"  {name}: {len(contributions)} genes with contributions")
     return all_contributions
 
@@ -152,20 +448,21 @@ def read_cue_unified(repo_root: str | None = None) -> dict:
     """
     # Get the main genes export
     genes_data = cue_export("genes", ["./model/"], cwd=repo_root)
-
     # Get the hidden source flags
     source_flags = cue_export("gene_sources", ["./model/"], cwd=repo_root)
-
-    # Merge _in_* flags back in
-    for symbol, flags in source_flags.items():
-        if symbol in genes_data:
-            for flag_name, flag_value in flags.items():
-                hidden_name = f"_{flag_name}"
-                genes_data[symbol][hidden_name] = flag_value
-
-    return genes_data
+    return _merge_source_flags(genes_data, source_flags)
 
 
 def read_cue_projection(expression: str, repo_root: str | None = None) -> dict:
     """Export a CUE projection expression as ground truth."""
     return cue_export(expression, ["./model/"], cwd=repo_root)
+
+
+def read_cue_projections(
+    expressions: list[str], repo_root: str | None = None,
+) -> list[dict]:
+    """Export several CUE projections concurrently, in the given order."""
+    return cue_export_parallel(
+        [(expression, ["./model/"]) for expression in expressions],
+        cwd=repo_root,
+    )